@@ -0,0 +1,25 @@
+"""Conditional GET support for rarely-changing API responses."""
+import hashlib
+from typing import Any
+
+import orjson
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison against an If-None-Match list (RFC 9110 13.1.2)."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(candidate.strip().removeprefix("W/") == etag for candidate in if_none_match.split(","))
+
+
+def etag_response(request: Request, content: Any) -> Response:
+    """JSON response tagged with a content hash; 304 if the client already has it."""
+    body = orjson.dumps(jsonable_encoder(content))
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
@@ -1,11 +1,12 @@
 """Health check and status routes."""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from typing import Annotated
 import logging
 from ...models.schemas import HealthResponse, StatsResponse
 from ...services.database import DatabaseService
 from ...services.vector_store import VectorStoreService
 from ...config import settings
+from ..etag import etag_response
 
 logger = logging.getLogger(__name__)
 
@@ -61,7 +62,7 @@ async def health_check(
 
 
 @router.get("/stats", response_model=StatsResponse)
-async def get_stats(database: Annotated[DatabaseService, Depends(get_database)]):
+async def get_stats(request: Request, database: Annotated[DatabaseService, Depends(get_database)]):
     """
     Get database statistics.
 
@@ -71,7 +72,7 @@ async def get_stats(database: Annotated[DatabaseService, Depends(get_database)])
     try:
         stats = database.get_stats()
 
-        return StatsResponse(**stats)
+        return etag_response(request, StatsResponse(**stats))
 
     except Exception as e:
         logger.error(f"Error getting stats: {e}")
@@ -1,9 +1,10 @@
 """Interventions API routes."""
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from typing import Annotated, List, Optional
 import logging
 from ...models.intervention import Intervention
 from ...services.database import DatabaseService
+from ..etag import etag_response
 from ..middleware.auth import verify_api_key
 
 logger = logging.getLogger(__name__)
@@ -94,12 +95,14 @@ async def get_intervention(
 
 @router.get("/categories/list", response_model=List[str])
 async def list_categories(
-    api_key: Annotated[str, Depends(verify_api_key)], database: Annotated[DatabaseService, Depends(get_database)]
+    request: Request,
+    api_key: Annotated[str, Depends(verify_api_key)],
+    database: Annotated[DatabaseService, Depends(get_database)],
 ):
     """Get list of all categories."""
     try:
         categories = database.get_categories()
-        return categories
+        return etag_response(request, categories)
     except Exception as e:
         logger.error(f"Error listing categories: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -107,12 +110,14 @@ async def list_categories(
 
 @router.get("/problems/list", response_model=List[str])
 async def list_problems(
-    api_key: Annotated[str, Depends(verify_api_key)], database: Annotated[DatabaseService, Depends(get_database)]
+    request: Request,
+    api_key: Annotated[str, Depends(verify_api_key)],
+    database: Annotated[DatabaseService, Depends(get_database)],
 ):
     """Get list of all problem types."""
     try:
         problems = database.get_problems()
-        return problems
+        return etag_response(request, problems)
     except Exception as e:
         logger.error(f"Error listing problems: {e}")
         raise HTTPException(status_code=500, detail=str(e))
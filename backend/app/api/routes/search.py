@@ -1,7 +1,10 @@
 """Search API routes."""
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
 from typing import Annotated
 import logging
+import orjson
 from ...models.schemas import SearchRequest, SearchResponse
 from ...core.orchestrator import QueryOrchestrator
 from ..middleware.auth import verify_api_key
@@ -49,3 +52,29 @@ async def search_interventions(
     except Exception as e:
         logger.error(f"Error processing search: {e}")
         raise HTTPException(status_code=500, detail=f"Error processing search: {str(e)}")
+
+
+@router.post("/stream")
+async def search_interventions_stream(
+    request: SearchRequest,
+    api_key: Annotated[str, Depends(verify_api_key)],
+    orchestrator: Annotated[QueryOrchestrator, Depends(get_orchestrator)],
+):
+    """
+    Search for road safety interventions, streaming the response as NDJSON.
+
+    Each line is {"event": ..., "data": ...}: one "result" per recommendation as soon as
+    ranking finishes, then "synthesis" and "metadata". Failures arrive as an "error" event,
+    since the status line has already been sent.
+    """
+    logger.info(f"Streaming search request: {request.query}")
+
+    async def events():
+        try:
+            async for event, data in orchestrator.stream_query(request):
+                yield orjson.dumps({"event": event, "data": jsonable_encoder(data)}) + b"\n"
+        except Exception as e:
+            logger.error(f"Error processing streaming search: {e}")
+            yield orjson.dumps({"event": "error", "data": {"detail": f"Error processing search: {str(e)}"}}) + b"\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
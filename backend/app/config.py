@@ -36,6 +36,7 @@ class Settings(BaseSettings):
     # Vector Store
     chroma_persist_dir: str = "./data/chroma_db"
     collection_name: str = "road_safety_interventions"
+    vector_store_backend: str = "chroma"  # "chroma" or "usearch" (int8-quantized)
 
     # Search Settings
     default_search_strategy: str = "hybrid"
@@ -1,5 +1,5 @@
 """Main query orchestrator."""
-from typing import List, Dict, Any, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 import time
 from ..models.schemas import SearchRequest, SearchResponse, SearchMetadata, ExtractedEntities
 from ..models.intervention import InterventionResult, InterventionRecommendation, Specifications, IRCReference
@@ -57,78 +57,135 @@ class QueryOrchestrator:
                     pass
                 return cached_response
 
-            # Extract entities
-            entities = await self.entity_extractor.extract(request.query)
-            logger.log_operation(
-                "entity_extraction",
-                "Entities extracted from query",
-                query_id=getattr(request, "request_id", None),
-                entities=entities.dict() if entities else {},
-            )
+            entities, filters, strategy, results, recommendations = await self._retrieve(request)
 
-            # Merge entities into filters if not provided
-            filters = self._merge_filters(request.filters.dict() if request.filters else {}, entities)
+            # Generate synthesis
+            synthesis = await self._generate_synthesis(request.query, results, entities)
 
-            # Select strategy
-            strategy = self._select_strategy(request.strategy)
-            logger.log_operation(
-                "strategy_selection",
-                f"Using search strategy: {strategy.name}",
-                strategy=strategy.name,
-                query_id=getattr(request, "request_id", None),
+            return self._finalize(
+                request, cache_key, start_time, entities, filters, strategy, results, recommendations, synthesis
             )
 
-            # Execute search
-            results = await strategy.search(query=request.query, filters=filters, max_results=request.max_results * 2)
+        except Exception as e:
+            logger.error("Error processing query", operation="query_error", error=str(e), error_type=type(e).__name__)
+            raise
 
-            # Post-process results
-            results = self.ranker.apply_boost(results, request.query)
-            results = self.ranker.deduplicate(results)
-            results = self.ranker.rank_by_confidence(results)
-            results = results[: request.max_results]
+    async def stream_query(self, request: SearchRequest) -> AsyncIterator[Tuple[str, Any]]:
+        """Process search query, yielding each recommendation before the (slower) synthesis."""
+        start_time = time.time()
 
-            # Convert to recommendations
-            recommendations = self._convert_to_recommendations(results)
+        try:
+            cache_key = generate_cache_key(request.query, request.filters.dict() if request.filters else None)
+            cached_response = self.cache_service.get(cache_key)
 
-            # Generate synthesis
-            synthesis = await self._generate_synthesis(request.query, results, entities)
+            if cached_response:
+                logger.log_operation(
+                    "cache_hit",
+                    "Streaming cached response",
+                    query_id=getattr(request, "request_id", None),
+                )
+                for recommendation in cached_response.results:
+                    yield "result", recommendation
+                yield "synthesis", cached_response.synthesis
+                yield "metadata", cached_response.metadata
+                return
 
-            # Build metadata
-            query_time_ms = int((time.time() - start_time) * 1000)
-            metadata = SearchMetadata(
-                search_strategy=strategy.name,
-                total_results=len(results),
-                query_time_ms=query_time_ms,
-                gemini_tokens=self.gemini_service.get_token_usage(),
-                entities_extracted=entities,
-            )
+            entities, filters, strategy, results, recommendations = await self._retrieve(request)
+            for recommendation in recommendations:
+                yield "result", recommendation
 
-            # Build response
-            response = SearchResponse(
-                query=request.query, results=recommendations, synthesis=synthesis, metadata=metadata
-            )
+            synthesis = await self._generate_synthesis(request.query, results, entities)
+            yield "synthesis", synthesis
 
-            # Calculate and log evaluation metrics
-            self._log_evaluation_metrics(
-                query=request.query,
-                results=results,
-                recommendations=recommendations,
-                entities=entities,
-                filters=filters,
-                strategy_name=strategy.name,
-                query_time_ms=query_time_ms,
+            response = self._finalize(
+                request, cache_key, start_time, entities, filters, strategy, results, recommendations, synthesis
             )
-
-            # Cache response
-            self.cache_service.set(cache_key, response)
-
-            logger.info("Query processed successfully", operation="query_processing", query_time_ms=query_time_ms)
-            return response
+            yield "metadata", response.metadata
 
         except Exception as e:
             logger.error("Error processing query", operation="query_error", error=str(e), error_type=type(e).__name__)
             raise
 
+    async def _retrieve(self, request: SearchRequest) -> tuple:
+        """Extract entities, run the search strategy and rank results."""
+        # Extract entities
+        entities = await self.entity_extractor.extract(request.query)
+        logger.log_operation(
+            "entity_extraction",
+            "Entities extracted from query",
+            query_id=getattr(request, "request_id", None),
+            entities=entities.dict() if entities else {},
+        )
+
+        # Merge entities into filters if not provided
+        filters = self._merge_filters(request.filters.dict() if request.filters else {}, entities)
+
+        # Select strategy
+        strategy = self._select_strategy(request.strategy)
+        logger.log_operation(
+            "strategy_selection",
+            f"Using search strategy: {strategy.name}",
+            strategy=strategy.name,
+            query_id=getattr(request, "request_id", None),
+        )
+
+        # Execute search
+        results = await strategy.search(query=request.query, filters=filters, max_results=request.max_results * 2)
+
+        # Post-process results
+        results = self.ranker.apply_boost(results, request.query)
+        results = self.ranker.deduplicate(results)
+        results = self.ranker.rank_by_confidence(results)
+        results = results[: request.max_results]
+
+        # Convert to recommendations
+        recommendations = self._convert_to_recommendations(results)
+
+        return entities, filters, strategy, results, recommendations
+
+    def _finalize(
+        self,
+        request: SearchRequest,
+        cache_key: str,
+        start_time: float,
+        entities: ExtractedEntities,
+        filters: Dict[str, Any],
+        strategy,
+        results: List[InterventionResult],
+        recommendations: List[InterventionRecommendation],
+        synthesis: str,
+    ) -> SearchResponse:
+        """Build, log and cache the response."""
+        # Build metadata
+        query_time_ms = int((time.time() - start_time) * 1000)
+        metadata = SearchMetadata(
+            search_strategy=strategy.name,
+            total_results=len(results),
+            query_time_ms=query_time_ms,
+            gemini_tokens=self.gemini_service.get_token_usage(),
+            entities_extracted=entities,
+        )
+
+        # Build response
+        response = SearchResponse(query=request.query, results=recommendations, synthesis=synthesis, metadata=metadata)
+
+        # Calculate and log evaluation metrics
+        self._log_evaluation_metrics(
+            query=request.query,
+            results=results,
+            recommendations=recommendations,
+            entities=entities,
+            filters=filters,
+            strategy_name=strategy.name,
+            query_time_ms=query_time_ms,
+        )
+
+        # Cache response
+        self.cache_service.set(cache_key, response)
+
+        logger.info("Query processed successfully", operation="query_processing", query_time_ms=query_time_ms)
+        return response
+
     def _select_strategy(self, strategy_name: Optional[str] = None):
         """Select appropriate search strategy."""
         if strategy_name == "rag":
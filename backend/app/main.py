@@ -86,7 +86,12 @@ async def startup_event():
         gemini_service = GeminiService()
 
         logger.info("Initializing vector store...")
-        vector_store_service = VectorStoreService(
+        if settings.vector_store_backend == "usearch":
+            # Native extension, only needed when the USearch backend is selected
+            from .services.usearch_store import UsearchVectorStore as vector_store_class
+        else:
+            vector_store_class = VectorStoreService
+        vector_store_service = vector_store_class(
             persist_directory=str(settings.chroma_dir), collection_name=settings.collection_name
         )
         # Get or create collection
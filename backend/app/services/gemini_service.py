@@ -1,4 +1,5 @@
 """Google Gemini API service."""
+import asyncio
 import google.generativeai as genai
 from typing import List, Dict, Any, Optional
 import json
@@ -13,6 +14,9 @@ logger = get_logger(__name__)
 class GeminiService:
     """Service for interacting with Google Gemini API."""
 
+    EMBEDDING_BATCH_SIZE = 20  # API limit
+    EMBEDDING_CONCURRENCY = 8  # Batches in flight at once
+
     def __init__(self):
         """Initialize Gemini service."""
         genai.configure(api_key=settings.gemini_api_key)
@@ -27,28 +31,33 @@ class GeminiService:
         logger.log_operation("service_init", "Gemini service initialized")
 
     @retry(stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=2, max=10))
+    def _embed_batch(self, batch: List[str]) -> List[List[float]]:
+        """Embed one batch of documents (blocking); retried on its own so other batches aren't redone."""
+        return [
+            genai.embed_content(
+                model=f"models/{settings.gemini_embedding_model}",
+                content=text,
+                task_type="retrieval_document",
+            )["embedding"]
+            for text in batch
+        ]
+
     async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """Generate embeddings for texts using Gemini Embedding API."""
         try:
-            embeddings = []
+            semaphore = asyncio.Semaphore(self.EMBEDDING_CONCURRENCY)
 
-            # Process in batches of 20 (API limit)
-            batch_size = 20
-            for i in range(0, len(texts), batch_size):
-                batch = texts[i : i + batch_size]
-
-                batch_embeddings = []
-                for text in batch:
-                    result = genai.embed_content(
-                        model=f"models/{settings.gemini_embedding_model}",
-                        content=text,
-                        task_type="retrieval_document",
-                    )
-                    batch_embeddings.append(result["embedding"])
-
-                embeddings.extend(batch_embeddings)
+            async def embed_batch(batch: List[str]) -> List[List[float]]:
+                async with semaphore:
+                    # embed_content is blocking, so overlap batches in worker threads
+                    batch_embeddings = await asyncio.to_thread(self._embed_batch, batch)
 
                 logger.debug("Generated embeddings batch", operation="embedding_generation", batch_size=len(batch_embeddings))
+                return batch_embeddings
+
+            batches = [texts[i : i + self.EMBEDDING_BATCH_SIZE] for i in range(0, len(texts), self.EMBEDDING_BATCH_SIZE)]
+            results = await asyncio.gather(*(embed_batch(batch) for batch in batches))
+            embeddings = [embedding for batch_embeddings in results for embedding in batch_embeddings]
 
             logger.log_operation("embedding_generation", f"Generated {len(embeddings)} total embeddings", total_embeddings=len(embeddings))
             return embeddings
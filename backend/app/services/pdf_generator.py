@@ -6,7 +6,9 @@ from reportlab.lib import colors
 from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak, Image as RLImage
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
 from datetime import datetime
+import gc
 import io
+import re
 import base64
 from typing import List, Dict, Any, Optional
 import logging
@@ -17,6 +19,10 @@ logger = logging.getLogger(__name__)
 class PDFReportGenerator:
     """Generate comprehensive PDF reports for road safety interventions."""
 
+    # Star ratings indexed by int(confidence * 5)
+    CONFIDENCE_STARS = ("", "⭐", "⭐⭐", "⭐⭐⭐", "⭐⭐⭐⭐", "⭐⭐⭐⭐⭐")
+    CONFIDENCE_TEMPLATE = '<font color="green">{stars} {percent:.0f}% Confidence</font>'
+
     def __init__(self):
         """Initialize PDF generator."""
         self.styles = getSampleStyleSheet()
@@ -24,43 +30,51 @@ class PDFReportGenerator:
         logger.info("PDF generator initialized")
 
     def _create_custom_styles(self):
-        """Create custom paragraph styles."""
+        """Create custom paragraph styles.
+
+        Styles are held as attributes rather than added to the sample
+        stylesheet, so generator instances never mutate shared state.
+        """
         # Title style
-        self.styles.add(
-            ParagraphStyle(
-                name="CustomTitle",
-                parent=self.styles["Heading1"],
-                fontSize=24,
-                textColor=colors.HexColor("#1f77b4"),
-                spaceAfter=30,
-                alignment=TA_CENTER,
-                fontName="Helvetica-Bold",
-            )
+        self.title_style = ParagraphStyle(
+            "CustomTitle",
+            parent=self.styles["Heading1"],
+            fontSize=24,
+            textColor=colors.HexColor("#1f77b4"),
+            spaceAfter=30,
+            alignment=TA_CENTER,
+            fontName="Helvetica-Bold",
         )
 
         # Heading style
-        self.styles.add(
-            ParagraphStyle(
-                name="CustomHeading",
-                parent=self.styles["Heading2"],
-                fontSize=16,
-                textColor=colors.HexColor("#2ca02c"),
-                spaceBefore=12,
-                spaceAfter=6,
-                fontName="Helvetica-Bold",
-            )
+        self.heading_style = ParagraphStyle(
+            "CustomHeading",
+            parent=self.styles["Heading2"],
+            fontSize=16,
+            textColor=colors.HexColor("#2ca02c"),
+            spaceBefore=12,
+            spaceAfter=6,
+            fontName="Helvetica-Bold",
         )
 
         # Confidence badge style
-        self.styles.add(
-            ParagraphStyle(
-                name="ConfidenceBadge",
-                parent=self.styles["Normal"],
-                fontSize=14,
-                textColor=colors.white,
-                alignment=TA_CENTER,
-                fontName="Helvetica-Bold",
-            )
+        self.badge_style = ParagraphStyle(
+            "ConfidenceBadge",
+            parent=self.styles["Normal"],
+            fontSize=14,
+            textColor=colors.white,
+            alignment=TA_CENTER,
+            fontName="Helvetica-Bold",
+        )
+
+        # Cover page query style
+        self.query_style = ParagraphStyle(
+            "QueryStyle",
+            parent=self.styles["Normal"],
+            fontSize=14,
+            textColor=colors.HexColor("#333333"),
+            alignment=TA_CENTER,
+            fontName="Helvetica-Oblique",
         )
 
     def generate_intervention_report(
@@ -70,13 +84,18 @@ class PDFReportGenerator:
         try:
             # Create PDF buffer
             buffer = io.BytesIO()
-            doc = SimpleDocTemplate(buffer, pagesize=A4, topMargin=0.5 * inch, bottomMargin=0.5 * inch)
+            doc = SimpleDocTemplate(
+                buffer, pagesize=A4, topMargin=0.5 * inch, bottomMargin=0.5 * inch, pageCompression=1
+            )
+
+            # Single timestamp shared by the cover page and the footer
+            generated_at = datetime.now()
 
             # Build story (content)
             story = []
 
             # Cover page
-            story.extend(self._create_cover_page(query, metadata))
+            story.extend(self._create_cover_page(query, metadata, generated_at))
             story.append(PageBreak())
 
             # Executive summary
@@ -100,11 +119,17 @@ class PDFReportGenerator:
 
             # Footer with metadata
             story.append(PageBreak())
-            story.extend(self._create_metadata_section(metadata))
+            story.extend(self._create_metadata_section(metadata, generated_at))
 
             # Build PDF
             doc.build(story)
 
+            # Flowables keep references to styles and layout state after build;
+            # drop them so repeated reports don't grow the process heap.
+            story.clear()
+            del doc
+            gc.collect()
+
             # Get PDF bytes
             pdf_bytes = buffer.getvalue()
             buffer.close()
@@ -116,35 +141,26 @@ class PDFReportGenerator:
             logger.error(f"Error generating PDF report: {e}")
             raise
 
-    def _create_cover_page(self, query: str, metadata: Dict[str, Any]) -> List:
+    def _create_cover_page(self, query: str, metadata: Dict[str, Any], generated_at: datetime) -> List:
         """Create cover page."""
         story = []
 
         # Title
         story.append(Spacer(1, 2 * inch))
-        title = Paragraph("🚦 Road Safety Intervention Report", self.styles["CustomTitle"])
+        title = Paragraph("🚦 Road Safety Intervention Report", self.title_style)
         story.append(title)
 
         story.append(Spacer(1, 0.5 * inch))
 
         # Query box
-        query_style = ParagraphStyle(
-            "QueryStyle",
-            parent=self.styles["Normal"],
-            fontSize=14,
-            textColor=colors.HexColor("#333333"),
-            alignment=TA_CENTER,
-            fontName="Helvetica-Oblique",
-        )
-
         query_text = f'<font color="#666666">Query:</font> "<b>{query}</b>"'
-        story.append(Paragraph(query_text, query_style))
+        story.append(Paragraph(query_text, self.query_style))
 
         story.append(Spacer(1, 1 * inch))
 
         # Report info table
         report_data = [
-            ["Report Generated:", datetime.now().strftime("%Y-%m-%d %H:%M:%S")],
+            ["Report Generated:", generated_at.strftime("%Y-%m-%d %H:%M:%S")],
             ["Total Results:", str(metadata.get("total_results", 0))],
             ["Search Strategy:", metadata.get("search_strategy", "N/A").upper()],
             ["Query Time:", f"{metadata.get('query_time_ms', 0)}ms"],
@@ -182,7 +198,7 @@ class PDFReportGenerator:
         story = []
 
         # Title
-        story.append(Paragraph("Executive Summary", self.styles["CustomHeading"]))
+        story.append(Paragraph("Executive Summary", self.heading_style))
         story.append(Spacer(1, 0.1 * inch))
 
         # Summary text
@@ -206,23 +222,24 @@ class PDFReportGenerator:
 
         # Intervention title with confidence
         confidence = intervention.get("confidence", 0)
-        stars = "⭐" * min(5, int(confidence * 5))
+        stars = self.CONFIDENCE_STARS[max(0, min(5, int(confidence * 5)))]
 
         title_text = f'<font size="14"><b>{idx}. {intervention.get("title", "Unknown")}</b></font>'
         story.append(Paragraph(title_text, self.styles["Normal"]))
 
         # Confidence badge
-        confidence_text = f'<font color="green">{stars} {confidence * 100:.0f}% Confidence</font>'
+        confidence_text = self.CONFIDENCE_TEMPLATE.format(stars=stars, percent=confidence * 100)
         story.append(Paragraph(confidence_text, self.styles["Normal"]))
 
         story.append(Spacer(1, 0.1 * inch))
 
         # Details table
+        irc = intervention.get("irc_reference") or {}
         details_data = [
             ["Category:", intervention.get("category", "N/A")],
             ["Problem:", intervention.get("problem", "N/A")],
             ["Type:", intervention.get("type", "N/A")],
-            ["IRC Reference:", f"{intervention.get('irc_reference', {}).get('code', 'N/A')} {intervention.get('irc_reference', {}).get('clause', '')}"],
+            ["IRC Reference:", f"{irc.get('code', 'N/A')} {irc.get('clause', '')}"],
             ["Cost Estimate:", intervention.get("cost_estimate", "N/A")],
             ["Installation Time:", intervention.get("installation_time", "N/A")],
         ]
@@ -246,11 +263,12 @@ class PDFReportGenerator:
         story.append(details_table)
         story.append(Spacer(1, 0.15 * inch))
 
-        # Specifications
+        # Specifications, explanation and maintenance share a single flowable;
+        # the section labels are inlined as bold markup.
+        body = []
+
         specs = intervention.get("specifications", {})
         if specs:
-            story.append(Paragraph("<b>Specifications:</b>", self.styles["Normal"]))
-
             specs_text = []
             if specs.get("dimensions"):
                 specs_text.append(f"• Dimensions: {specs['dimensions']}")
@@ -259,21 +277,20 @@ class PDFReportGenerator:
             if specs.get("placement"):
                 specs_text.append(f"• Placement: {specs['placement']}")
 
-            if specs_text:
-                story.append(Paragraph("<br/>".join(specs_text), self.styles["Normal"]))
-                story.append(Spacer(1, 0.1 * inch))
+            body.append("<b>Specifications:</b>")
+            body.extend(specs_text)
+            body.append("")
 
-        # Explanation
         explanation = intervention.get("explanation", "No explanation available")
-        story.append(Paragraph("<b>Explanation:</b>", self.styles["Normal"]))
-        story.append(Paragraph(explanation, self.styles["Normal"]))
-
-        story.append(Spacer(1, 0.1 * inch))
+        body.append("<b>Explanation:</b>")
+        body.append(explanation)
+        body.append("")
 
-        # Maintenance
         maintenance = intervention.get("maintenance", "Standard maintenance required")
-        story.append(Paragraph("<b>Maintenance:</b>", self.styles["Normal"]))
-        story.append(Paragraph(maintenance, self.styles["Normal"]))
+        body.append("<b>Maintenance:</b>")
+        body.append(maintenance)
+
+        story.append(Paragraph("<br/>".join(body), self.styles["Normal"]))
 
         return story
 
@@ -281,21 +298,25 @@ class PDFReportGenerator:
         """Create AI synthesis section."""
         story = []
 
-        story.append(Paragraph("AI Analysis & Recommendations", self.styles["CustomHeading"]))
+        story.append(Paragraph("AI Analysis & Recommendations", self.heading_style))
         story.append(Spacer(1, 0.1 * inch))
 
         # Convert markdown-like syntax to paragraph-friendly format
         synthesis_clean = synthesis.replace("**", "<b>").replace("##", "<br/><br/><b>").replace("*", "")
 
-        story.append(Paragraph(synthesis_clean[:2000], self.styles["Normal"]))  # Limit length
+        # One Paragraph per block keeps reportlab's wrapping cost linear in length
+        for chunk in re.split(r"\n\s*\n|<br/><br/>", synthesis_clean[:2000]):  # Limit length
+            if chunk.strip():
+                story.append(Paragraph(chunk, self.styles["Normal"]))
+                story.append(Spacer(1, 0.05 * inch))
 
         return story
 
-    def _create_metadata_section(self, metadata: Dict[str, Any]) -> List:
+    def _create_metadata_section(self, metadata: Dict[str, Any], generated_at: datetime) -> List:
         """Create metadata section."""
         story = []
 
-        story.append(Paragraph("Technical Metadata", self.styles["CustomHeading"]))
+        story.append(Paragraph("Technical Metadata", self.heading_style))
         story.append(Spacer(1, 0.1 * inch))
 
         # Metadata table
@@ -329,7 +350,7 @@ class PDFReportGenerator:
         story.append(Spacer(1, 0.5 * inch))
         footer_text = f"""
         <font size="8" color="#999999">
-        Report generated on {datetime.now().strftime("%Y-%m-%d at %H:%M:%S")} |
+        Report generated on {generated_at.strftime("%Y-%m-%d at %H:%M:%S")} |
         Road Safety Intervention AI v1.0 |
         Powered by Google Gemini
         </font>
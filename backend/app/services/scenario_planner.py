@@ -2,6 +2,7 @@
 from typing import List, Dict, Any, Optional
 import logging
 from datetime import datetime, timedelta
+from functools import lru_cache
 import re
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,13 @@ class ScenarioPlanner:
     # Priority weights
     PRIORITY_WEIGHTS = {"Critical": 100, "High": 75, "Medium": 50, "Low": 25}
 
+    # Problem keyword groups and their base weight, checked in order
+    PROBLEM_KEYWORD_WEIGHTS = (
+        (("damaged", "missing", "critical"), 100),
+        (("faded", "visibility", "obstruction"), 75),
+        (("spacing", "placement", "height"), 50),
+    )
+
     def __init__(self):
         """Initialize scenario planner."""
         logger.info("Scenario planner initialized")
@@ -81,35 +89,18 @@ class ScenarioPlanner:
 
     def _enrich_intervention(self, intervention: Dict[str, Any]) -> Dict[str, Any]:
         """Enrich intervention with cost and time estimates."""
-        enriched = intervention.copy()
-
-        # Parse cost estimate
-        cost_text = intervention.get("cost_estimate", "Medium")
-        cost_min, cost_max = self._parse_cost(cost_text)
-        cost_avg = (cost_min + cost_max) / 2
-
-        enriched["estimated_cost_min"] = cost_min
-        enriched["estimated_cost_max"] = cost_max
-        enriched["estimated_cost_avg"] = cost_avg
-
-        # Parse time estimate
-        time_text = intervention.get("installation_time", "Variable")
-        time_hours = self._parse_time(time_text)
-
-        enriched["estimated_time_hours"] = time_hours
-
-        # Calculate priority score
-        problem = intervention.get("problem", "")
-        category = intervention.get("category", "")
-        confidence = intervention.get("confidence", 0.5)
-
-        priority_score = self._calculate_priority_score(problem, category, confidence)
-        enriched["priority_score"] = priority_score
-        enriched["priority_level"] = self._get_priority_level(priority_score)
-
-        return enriched
-
-    def _parse_cost(self, cost_text: str) -> tuple:
+        enrichment = _compute_enrichment(
+            intervention.get("cost_estimate", "Medium"),
+            intervention.get("installation_time", "Variable"),
+            intervention.get("problem", ""),
+            intervention.get("category", ""),
+            intervention.get("confidence", 0.5),
+        )
+
+        return {**intervention, **enrichment}
+
+    @classmethod
+    def _parse_cost(cls, cost_text: str) -> tuple:
         """Parse cost estimate text."""
         # Try to extract numbers from text
         numbers = re.findall(r"₹?([\d,]+)", cost_text)
@@ -120,15 +111,16 @@ class ScenarioPlanner:
             cost_max = float(numbers[1].replace(",", ""))
             return (cost_min, cost_max)
         elif "Low" in cost_text:
-            return self.COST_RANGES["Low"]
+            return cls.COST_RANGES["Low"]
         elif "High" in cost_text:
-            return self.COST_RANGES["High"]
+            return cls.COST_RANGES["High"]
         else:
-            return self.COST_RANGES["Medium"]
+            return cls.COST_RANGES["Medium"]
 
-    def _parse_time(self, time_text: str) -> float:
+    @classmethod
+    def _parse_time(cls, time_text: str) -> float:
         """Parse time estimate text to hours."""
-        for pattern, hours in self.TIME_RANGES.items():
+        for pattern, hours in cls.TIME_RANGES.items():
             if pattern in time_text:
                 return hours
 
@@ -145,19 +137,17 @@ class ScenarioPlanner:
 
         return 24  # Default: 1 day
 
-    def _calculate_priority_score(self, problem: str, category: str, confidence: float) -> float:
+    @classmethod
+    def _calculate_priority_score(cls, problem: str, category: str, confidence: float) -> float:
         """Calculate priority score for intervention."""
         # Base score from problem type
-        problem_weight = 50
-
-        if any(keyword in problem.lower() for keyword in ["damaged", "missing", "critical"]):
-            problem_weight = 100
-        elif any(keyword in problem.lower() for keyword in ["faded", "visibility", "obstruction"]):
-            problem_weight = 75
-        elif any(keyword in problem.lower() for keyword in ["spacing", "placement", "height"]):
-            problem_weight = 50
-        else:
-            problem_weight = 30
+        problem_lower = problem.lower()
+        problem_weight = 30
+
+        for keywords, weight in cls.PROBLEM_KEYWORD_WEIGHTS:
+            if any(keyword in problem_lower for keyword in keywords):
+                problem_weight = weight
+                break
 
         # Category multiplier
         category_multiplier = 1.0
@@ -176,7 +166,8 @@ class ScenarioPlanner:
 
         return min(100, score)  # Cap at 100
 
-    def _get_priority_level(self, score: float) -> str:
+    @staticmethod
+    def _get_priority_level(score: float) -> str:
         """Get priority level from score."""
         if score >= 80:
             return "Critical"
@@ -212,26 +203,30 @@ class ScenarioPlanner:
     ) -> List[Dict[str, Any]]:
         """Create implementation timeline."""
         timeline = []
-        current_date = datetime.now()
+        start = datetime.now()
+        start_date = start.date().isoformat()
+        elapsed_hours = 0.0
 
         for idx, intervention in enumerate(interventions, 1):
+            duration_hours = intervention["estimated_time_hours"]
+            elapsed_hours += duration_hours
+            end_date = (start + timedelta(hours=elapsed_hours)).date().isoformat()
+
             task = {
                 "sequence": idx,
                 "intervention": intervention["title"],
                 "priority": intervention["priority_level"],
-                "start_date": current_date.strftime("%Y-%m-%d"),
-                "duration_hours": intervention["estimated_time_hours"],
-                "duration_days": intervention["estimated_time_hours"] / 24,
+                "start_date": start_date,
+                "duration_hours": duration_hours,
+                "duration_days": duration_hours / 24,
                 "cost": f"₹{intervention['estimated_cost_avg']:,.0f}",
-                "end_date": (current_date + timedelta(hours=intervention["estimated_time_hours"])).strftime(
-                    "%Y-%m-%d"
-                ),
+                "end_date": end_date,
             }
 
             timeline.append(task)
 
-            # Move to next start date
-            current_date += timedelta(hours=intervention["estimated_time_hours"])
+            # Next task starts when this one ends
+            start_date = end_date
 
         return timeline
 
@@ -314,3 +309,26 @@ class ScenarioPlanner:
         except Exception as e:
             logger.error(f"Error optimizing budget: {e}")
             return {"error": str(e), "optimized": False}
+
+
+@lru_cache(maxsize=1024)
+def _compute_enrichment(cost_text: str, time_text: str, problem: str, category: str, confidence: float) -> Dict[str, Any]:
+    """Compute cost, time and priority estimates (cached; treat result as read-only)."""
+    # Parse cost estimate
+    cost_min, cost_max = ScenarioPlanner._parse_cost(cost_text)
+    cost_avg = (cost_min + cost_max) / 2
+
+    # Parse time estimate
+    time_hours = ScenarioPlanner._parse_time(time_text)
+
+    # Calculate priority score
+    priority_score = ScenarioPlanner._calculate_priority_score(problem, category, confidence)
+
+    return {
+        "estimated_cost_min": cost_min,
+        "estimated_cost_max": cost_max,
+        "estimated_cost_avg": cost_avg,
+        "estimated_time_hours": time_hours,
+        "priority_score": priority_score,
+        "priority_level": ScenarioPlanner._get_priority_level(priority_score),
+    }
@@ -0,0 +1,308 @@
+"""Quantized vector store service using USearch."""
+from usearch.index import Index
+import numpy as np
+from cachetools import LRUCache
+from typing import List, Dict, Any, Optional, Union
+import json
+import logging
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class UsearchVectorStore:
+    """Drop-in replacement for VectorStoreService backed by an int8 USearch index.
+
+    Vectors are scalar-quantized to int8 before indexing, cutting resident
+    index memory to a quarter of float32. The quantizer is a single global
+    scale fitted on the first batch loaded, which leaves cosine distances
+    unchanged apart from rounding. Documents and metadata live in a JSON
+    sidecar next to the index file; writes stay in memory until ``persist``.
+    """
+
+    def __init__(
+        self,
+        persist_directory: str,
+        collection_name: str,
+        hnsw_m: int = 16,
+        hnsw_construction_ef: int = 200,
+        hnsw_search_ef: int = 100,
+        dtype: str = "i8",
+        query_cache_size: int = 1024,
+    ):
+        """Initialize vector store."""
+        self.persist_directory = Path(persist_directory)
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+
+        self.collection_name = collection_name
+        self.index_path = self.persist_directory / f"{collection_name}.usearch"
+        self.sidecar_path = self.persist_directory / f"{collection_name}.json"
+
+        self.hnsw_m = hnsw_m
+        self.hnsw_construction_ef = hnsw_construction_ef
+        self.hnsw_search_ef = hnsw_search_ef
+        self.dtype = dtype
+
+        self.collection: Optional[Index] = None
+        self.scale: Optional[float] = None
+        self.ids: List[str] = []
+        self.documents: List[str] = []
+        self.metadatas: List[Dict[str, Any]] = []
+
+        # Document id -> index key (its position in the lists above)
+        self.positions: Dict[str, int] = {}
+
+        # Search results for repeated queries
+        self.query_cache: LRUCache = LRUCache(maxsize=query_cache_size)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+        logger.info(f"USearch vector store initialized at {persist_directory}")
+
+    def _new_index(self, ndim: int) -> Index:
+        """Create an empty index for vectors of the given dimension."""
+        return Index(
+            ndim=ndim,
+            metric="cos",
+            dtype=self.dtype,
+            connectivity=self.hnsw_m,
+            expansion_add=self.hnsw_construction_ef,
+            expansion_search=self.hnsw_search_ef,
+        )
+
+    def _quantize(self, vectors: np.ndarray) -> np.ndarray:
+        """Scale vectors into the index dtype's range."""
+        if self.dtype != "i8":
+            return vectors
+
+        if self.scale is None:
+            # 99.9th percentile of magnitudes keeps outliers from wasting int8 range
+            self.scale = 127.0 / max(float(np.quantile(np.abs(vectors), 0.999)), 1e-12)
+
+        return np.clip(np.rint(vectors * self.scale), -127, 127).astype(np.int8)
+
+    def persist(self):
+        """Write the index and sidecar data to disk."""
+        if self.collection is not None:
+            self.collection.save(str(self.index_path))
+
+        with open(self.sidecar_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {"scale": self.scale, "ids": self.ids, "documents": self.documents, "metadatas": self.metadatas},
+                f,
+                ensure_ascii=False,
+            )
+
+    def create_collection(self) -> Optional[Index]:
+        """Create an empty collection, discarding any persisted one."""
+        self.delete_collection()
+
+        self.collection = None
+        self.scale = None
+        self.ids, self.documents, self.metadatas = [], [], []
+        self.positions = {}
+        self.query_cache.clear()
+
+        logger.info(f"Created collection: {self.collection_name}")
+        return self.collection
+
+    def get_collection(self) -> Optional[Index]:
+        """Load persisted collection, or create an empty one."""
+        if not (self.index_path.exists() and self.sidecar_path.exists()):
+            logger.warning(f"Collection not found: {self.collection_name}")
+            return self.create_collection()
+
+        try:
+            with open(self.sidecar_path, "r", encoding="utf-8") as f:
+                sidecar = json.load(f)
+
+            self.scale = sidecar["scale"]
+            self.ids = sidecar["ids"]
+            self.documents = sidecar["documents"]
+            self.metadatas = sidecar["metadatas"]
+            self.positions = {id: position for position, id in enumerate(self.ids)}
+            self.query_cache.clear()
+            self.collection = Index.restore(str(self.index_path))
+
+            logger.info(f"Retrieved collection: {self.collection_name}")
+            return self.collection
+
+        except Exception as e:
+            logger.error(f"Error getting collection: {e}")
+            return self.create_collection()
+
+    def add_documents(
+        self,
+        documents: List[str],
+        embeddings: Union[np.ndarray, List[List[float]]],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        batch_size: int = 512,
+    ):
+        """Add documents to collection in fixed-size batches."""
+        try:
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            if embeddings.ndim != 2 or embeddings.shape[0] != len(ids):
+                raise ValueError(f"Expected embeddings of shape ({len(ids)}, d), got {embeddings.shape}")
+
+            if self.collection is None:
+                self.collection = self._new_index(embeddings.shape[1])
+
+            for start in range(0, len(ids), batch_size):
+                end = start + batch_size
+                offset = len(self.ids)
+                keys = np.arange(offset, offset + len(ids[start:end]), dtype=np.uint64)
+
+                self.collection.add(keys, self._quantize(embeddings[start:end]))
+                self.positions.update(zip(ids[start:end], range(offset, offset + len(keys))))
+                self.ids.extend(ids[start:end])
+                self.documents.extend(documents[start:end])
+                self.metadatas.extend(metadatas[start:end])
+
+            self.query_cache.clear()
+            logger.info(f"Added {len(documents)} documents to collection")
+
+        except Exception as e:
+            logger.error(f"Error adding documents: {e}")
+            raise
+
+    def create_bulk_collection(self, batch_size: int = 1000) -> Optional[Index]:
+        """Recreate the collection for a full-corpus ingest; USearch needs no ingest tuning."""
+        return self.create_collection()
+
+    def bulk_load(
+        self,
+        documents: List[str],
+        embeddings: Union[np.ndarray, List[List[float]]],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        batch_size: int = 1000,
+    ):
+        """Recreate the collection and load a full corpus into it."""
+        self.create_bulk_collection(batch_size=batch_size)
+        self.add_documents(documents, embeddings, metadatas, ids, batch_size=batch_size)
+        self.persist()
+
+    # Where-clause operators _matches understands
+    WHERE_OPERATORS = ("$in", "$eq")
+
+    @classmethod
+    def _validate_where(cls, where: Dict[str, Any]):
+        """Reject where clauses using operators _matches would otherwise ignore."""
+        for field, condition in where.items():
+            if field.startswith("$"):
+                raise ValueError(f"Unsupported where operator: {field}")
+            if isinstance(condition, dict):
+                unsupported = [op for op in condition if op not in cls.WHERE_OPERATORS]
+                if unsupported:
+                    raise ValueError(f"Unsupported where operator(s) for {field}: {', '.join(unsupported)}")
+
+    @staticmethod
+    def _matches(metadata: Dict[str, Any], where: Dict[str, Any]) -> bool:
+        """Check metadata against a Chroma-style where clause (equality / $in)."""
+        for field, condition in where.items():
+            value = metadata.get(field)
+            if isinstance(condition, dict):
+                if "$in" in condition and value not in condition["$in"]:
+                    return False
+                if "$eq" in condition and value != condition["$eq"]:
+                    return False
+            elif value != condition:
+                return False
+        return True
+
+    def search(
+        self,
+        query_embedding: Union[np.ndarray, List[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Search for similar documents."""
+        if where:
+            self._validate_where(where)
+
+        if self.collection is None:
+            self.get_collection()
+
+        empty = {"ids": [[]], "distances": [[]], "metadatas": [[]], "documents": [[]]}
+        if self.collection is None or not self.ids:
+            return empty
+
+        try:
+            query_vector = np.asarray(query_embedding, dtype=np.float32).reshape(-1)
+
+            cache_key = (query_vector.tobytes(), n_results, json.dumps(where, sort_keys=True))
+            results = self.query_cache.get(cache_key)
+            if results is not None:
+                self.cache_hits += 1
+                return results
+
+            self.cache_misses += 1
+            query_vector = self._quantize(query_vector)
+
+            # Over-fetch when filtering, since the filter is applied after the ANN search
+            count = len(self.ids) if where else min(n_results, len(self.ids))
+            matches = self.collection.search(query_vector, count)
+
+            result_ids, distances, metadatas, documents = [], [], [], []
+            for key, distance in zip(matches.keys, matches.distances):
+                metadata = self.metadatas[int(key)]
+                if where and not self._matches(metadata, where):
+                    continue
+
+                result_ids.append(self.ids[int(key)])
+                distances.append(float(distance))
+                metadatas.append(metadata)
+                documents.append(self.documents[int(key)])
+
+                if len(result_ids) == n_results:
+                    break
+
+            results = {"ids": [result_ids], "distances": [distances], "metadatas": [metadatas], "documents": [documents]}
+            self.query_cache[cache_key] = results
+
+            logger.debug(f"Found {len(result_ids)} results")
+            return results
+
+        except Exception as e:
+            logger.error(f"Error searching: {e}")
+            return empty
+
+    def get_by_id(self, id: str) -> Optional[Dict[str, Any]]:
+        """Get document by ID."""
+        if self.collection is None:
+            self.get_collection()
+
+        position = self.positions.get(id)
+        if position is None:
+            return None
+        return {"id": id, "metadata": self.metadatas[position], "document": self.documents[position]}
+
+    def count(self) -> int:
+        """Get count of documents in collection."""
+        if self.collection is None:
+            self.get_collection()
+
+        return len(self.ids)
+
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get search result cache statistics."""
+        total = self.cache_hits + self.cache_misses
+        hit_rate = (self.cache_hits / total * 100) if total > 0 else 0
+
+        return {
+            "size": len(self.query_cache),
+            "maxsize": self.query_cache.maxsize,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": f"{hit_rate:.2f}%",
+        }
+
+    def delete_collection(self):
+        """Delete the collection."""
+        try:
+            self.index_path.unlink(missing_ok=True)
+            self.sidecar_path.unlink(missing_ok=True)
+            logger.info(f"Deleted collection: {self.collection_name}")
+        except Exception as e:
+            logger.error(f"Error deleting collection: {e}")
@@ -1,18 +1,45 @@
 """Vector store service using ChromaDB."""
 import chromadb
 from chromadb.config import Settings
-from typing import List, Dict, Any, Optional
+import numpy as np
+from cachetools import LRUCache
+from typing import List, Dict, Any, Optional, Union
+import json
 import logging
+import os
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
 
 class VectorStoreService:
-    """Service for vector similarity search using ChromaDB."""
+    """Service for vector similarity search using ChromaDB.
 
-    def __init__(self, persist_directory: str, collection_name: str):
-        """Initialize vector store."""
+    Initial index builds should go through ``bulk_load``, or
+    ``create_bulk_collection`` followed by ``add_documents`` per chunk when the
+    corpus is produced incrementally; both create the collection with
+    ingest-friendly batching before inserting.
+    ChromaDB fixes ``hnsw:M`` and the ef parameters when a collection is
+    created, so the query-time graph settings are applied up front.
+    """
+
+    def __init__(
+        self,
+        persist_directory: str,
+        collection_name: str,
+        hnsw_m: int = 16,
+        hnsw_construction_ef: int = 200,
+        hnsw_search_ef: int = 100,
+        hnsw_num_threads: Optional[int] = None,
+        query_cache_size: int = 1024,
+    ):
+        """Initialize vector store.
+
+        The ``hnsw_*`` arguments tune the HNSW index built by ``create_collection``:
+        ``hnsw_m`` is the graph degree, ``hnsw_construction_ef`` / ``hnsw_search_ef``
+        trade build/query time for recall. ``query_cache_size`` bounds the LRU of
+        search results keyed on the query embedding.
+        """
         self.persist_directory = Path(persist_directory)
         self.persist_directory.mkdir(parents=True, exist_ok=True)
 
@@ -25,9 +52,19 @@ class VectorStoreService:
         self.collection_name = collection_name
         self.collection = None
 
+        self.hnsw_m = hnsw_m
+        self.hnsw_construction_ef = hnsw_construction_ef
+        self.hnsw_search_ef = hnsw_search_ef
+        self.hnsw_num_threads = hnsw_num_threads or os.cpu_count() or 1
+
+        # Search results for repeated queries
+        self.query_cache: LRUCache = LRUCache(maxsize=query_cache_size)
+        self.cache_hits = 0
+        self.cache_misses = 0
+
         logger.info(f"Vector store initialized at {persist_directory}")
 
-    def create_collection(self) -> chromadb.Collection:
+    def create_collection(self, index_overrides: Optional[Dict[str, Any]] = None) -> chromadb.Collection:
         """Create or get collection."""
         try:
             # Delete existing collection if it exists (for fresh start)
@@ -38,9 +75,17 @@ class VectorStoreService:
                 pass
 
             # Create new collection
+            self.query_cache.clear()
             self.collection = self.client.create_collection(
                 name=self.collection_name,
-                metadata={"hnsw:space": "cosine"},  # Cosine similarity
+                metadata={
+                    "hnsw:space": "cosine",  # Cosine similarity
+                    "hnsw:M": self.hnsw_m,
+                    "hnsw:construction_ef": self.hnsw_construction_ef,
+                    "hnsw:search_ef": self.hnsw_search_ef,
+                    "hnsw:num_threads": self.hnsw_num_threads,
+                    **(index_overrides or {}),
+                },
             )
 
             logger.info(f"Created collection: {self.collection_name}")
@@ -64,32 +109,91 @@ class VectorStoreService:
     def add_documents(
         self,
         documents: List[str],
-        embeddings: List[List[float]],
+        embeddings: Union[np.ndarray, List[List[float]]],
         metadatas: List[Dict[str, Any]],
         ids: List[str],
+        batch_size: int = 512,
     ):
-        """Add documents to collection."""
+        """Add documents to collection in fixed-size batches.
+
+        Embeddings are held as a contiguous float32 ``(n, d)`` array; each
+        batch is converted to lists only at the ChromaDB boundary.
+        """
         if self.collection is None:
             self.get_collection()
 
         try:
-            self.collection.add(documents=documents, embeddings=embeddings, metadatas=metadatas, ids=ids)
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            if embeddings.ndim != 2 or embeddings.shape[0] != len(ids):
+                raise ValueError(f"Expected embeddings of shape ({len(ids)}, d), got {embeddings.shape}")
+
+            for start in range(0, len(ids), batch_size):
+                end = start + batch_size
+                self.collection.add(
+                    documents=documents[start:end],
+                    embeddings=embeddings[start:end].tolist(),
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end],
+                )
 
+            self.query_cache.clear()
             logger.info(f"Added {len(documents)} documents to collection")
 
         except Exception as e:
             logger.error(f"Error adding documents: {e}")
             raise
 
+    def persist(self):
+        """No-op: the persistent ChromaDB client writes through on every add."""
+
+    def create_bulk_collection(self, batch_size: int = 1000) -> chromadb.Collection:
+        """Recreate the collection tuned for a full-corpus ingest.
+
+        Writes are buffered into HNSW batches of ``batch_size`` (``hnsw:batch_size``),
+        so the graph is extended with all index threads at once, and the index is
+        synced to disk every few batches rather than on every small write.
+        """
+        return self.create_collection(
+            index_overrides={"hnsw:batch_size": batch_size, "hnsw:sync_threshold": batch_size * 4}
+        )
+
+    def bulk_load(
+        self,
+        documents: List[str],
+        embeddings: Union[np.ndarray, List[List[float]]],
+        metadatas: List[Dict[str, Any]],
+        ids: List[str],
+        batch_size: int = 1000,
+    ):
+        """Recreate the collection and load a full corpus into it.
+
+        Each ``add`` call lines up with one HNSW batch.
+        """
+        self.create_bulk_collection(batch_size=batch_size)
+        self.add_documents(documents, embeddings, metadatas, ids, batch_size=batch_size)
+
     def search(
-        self, query_embedding: List[float], n_results: int = 10, where: Optional[Dict[str, Any]] = None
+        self,
+        query_embedding: Union[np.ndarray, List[float]],
+        n_results: int = 10,
+        where: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Search for similar documents."""
         if self.collection is None:
             self.get_collection()
 
         try:
-            results = self.collection.query(query_embeddings=[query_embedding], n_results=n_results, where=where)
+            query_vector = np.asarray(query_embedding, dtype=np.float32).reshape(1, -1)
+
+            cache_key = (query_vector.tobytes(), n_results, json.dumps(where, sort_keys=True))
+            results = self.query_cache.get(cache_key)
+            if results is not None:
+                self.cache_hits += 1
+                return results
+
+            self.cache_misses += 1
+            results = self.collection.query(query_embeddings=query_vector.tolist(), n_results=n_results, where=where)
+            self.query_cache[cache_key] = results
 
             logger.debug(f"Found {len(results['ids'][0])} results")
             return results
@@ -129,9 +233,23 @@ class VectorStoreService:
             logger.error(f"Error counting documents: {e}")
             return 0
 
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """Get search result cache statistics."""
+        total = self.cache_hits + self.cache_misses
+        hit_rate = (self.cache_hits / total * 100) if total > 0 else 0
+
+        return {
+            "size": len(self.query_cache),
+            "maxsize": self.query_cache.maxsize,
+            "hits": self.cache_hits,
+            "misses": self.cache_misses,
+            "hit_rate": f"{hit_rate:.2f}%",
+        }
+
     def delete_collection(self):
         """Delete the collection."""
         try:
+            self.query_cache.clear()
             self.client.delete_collection(name=self.collection_name)
             logger.info(f"Deleted collection: {self.collection_name}")
         except Exception as e:
@@ -5,9 +5,29 @@ import base64
 from typing import Dict, Any, Optional, Tuple
 import logging
 import math
+from functools import lru_cache
 
 logger = logging.getLogger(__name__)
 
+# Font files
+FONT_BOLD_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf"
+FONT_REGULAR_PATH = "/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf"
+
+
+@lru_cache(maxsize=None)
+def _load_font(path: str, size: int) -> ImageFont.ImageFont:
+    """Load a TrueType font once per (path, size), falling back to PIL's default."""
+    try:
+        return ImageFont.truetype(path, size)
+    except OSError:
+        logger.warning(f"Font not found: {path}, using default font")
+        return ImageFont.load_default()
+
+
+# Parsed once at import; every generator instance shares these
+_FONT_TITLE = _load_font(FONT_BOLD_PATH, 60)
+_FONT_LABEL = _load_font(FONT_REGULAR_PATH, 16)
+
 
 class VisualGenerator:
     """Generate visual representations of road signs and markings."""
@@ -23,8 +43,16 @@ class VisualGenerator:
         "orange": "#FFA500",
     }
 
-    def __init__(self):
-        """Initialize visual generator."""
+    # Unit-circle vertices of a regular octagon
+    OCTAGON_UNIT = tuple((math.cos(math.pi / 4 * i), math.sin(math.pi / 4 * i)) for i in range(8))
+
+    def __init__(self, image_format: str = "png"):
+        """Initialize visual generator.
+
+        ``image_format`` is "png" (16-colour palette PNG) or "webp".
+        """
+        self.image_format = image_format.lower()
+
         logger.info("Visual generator initialized")
 
     def generate_road_sign(
@@ -38,60 +66,64 @@ class VisualGenerator:
     ) -> str:
         """Generate road sign image and return as base64."""
         try:
-            # Create image with white background
-            img = Image.new("RGB", (size, size), self.COLORS.get("white", "#FFFFFF"))
-            draw = ImageDraw.Draw(img)
-
-            # Draw based on shape
-            if "octagonal" in shape.lower() or "STOP" in sign_type:
-                self._draw_octagon(draw, size, colors)
-                text = text or "STOP"
-            elif "triangular" in shape.lower() or "triangle" in shape.lower():
-                self._draw_triangle(draw, size, colors)
-            elif "circular" in shape.lower() or "circle" in shape.lower():
-                self._draw_circle(draw, size, colors)
-            elif "rectangular" in shape.lower() or "rectangle" in shape.lower():
-                self._draw_rectangle(draw, size, colors)
-            else:
-                # Default to circle
-                self._draw_circle(draw, size, colors)
-
-            # Add text if provided
-            if text:
-                self._add_text(draw, size, text, colors)
-
-            # Add dimensions label
-            if dimensions:
-                self._add_dimension_label(draw, size, dimensions)
-
-            # Convert to base64
-            return self._image_to_base64(img)
-
+            return self._render_road_sign(self.image_format, sign_type, shape, tuple(colors), dimensions, text, size)
         except Exception as e:
             logger.error(f"Error generating road sign: {e}")
             return ""
 
-    def _draw_octagon(self, draw: ImageDraw, size: int, colors: list):
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _render_road_sign(
+        cls, image_format: str, sign_type: str, shape: str, colors: tuple, dimensions: str, text: Optional[str], size: int
+    ) -> str:
+        """Render a road sign; memoized on the (hashable) inputs, so failures raise rather than cache."""
+        # Create image with white background
+        img = Image.new("RGB", (size, size), cls.COLORS.get("white", "#FFFFFF"))
+        draw = ImageDraw.Draw(img)
+
+        # Draw based on shape
+        if "octagonal" in shape.lower() or "STOP" in sign_type:
+            cls._draw_octagon(draw, size, colors)
+            text = text or "STOP"
+        elif "triangular" in shape.lower() or "triangle" in shape.lower():
+            cls._draw_triangle(draw, size, colors)
+        elif "circular" in shape.lower() or "circle" in shape.lower():
+            cls._draw_circle(draw, size, colors)
+        elif "rectangular" in shape.lower() or "rectangle" in shape.lower():
+            cls._draw_rectangle(draw, size, colors)
+        else:
+            # Default to circle
+            cls._draw_circle(draw, size, colors)
+
+        # Add text if provided
+        if text:
+            cls._add_text(draw, size, text, colors)
+
+        # Add dimensions label
+        if dimensions:
+            cls._add_dimension_label(draw, size, dimensions)
+
+        # Convert to base64
+        return cls._image_to_base64(img, image_format)
+
+    @classmethod
+    def _draw_octagon(cls, draw: ImageDraw, size: int, colors: list):
         """Draw octagonal STOP sign."""
         center = size // 2
         radius = size // 2 - 20
 
-        # Calculate octagon points
-        points = []
-        for i in range(8):
-            angle = math.pi / 4 * i
-            x = center + radius * math.cos(angle)
-            y = center + radius * math.sin(angle)
-            points.append((x, y))
+        # Scale precomputed octagon vertices
+        points = [(center + radius * ux, center + radius * uy) for ux, uy in cls.OCTAGON_UNIT]
 
         # Get colors
-        bg_color = self.COLORS.get(colors[0] if colors else "red", "#FF0000")
-        border_color = self.COLORS.get(colors[1] if len(colors) > 1 else "white", "#FFFFFF")
+        bg_color = cls.COLORS.get(colors[0] if colors else "red", "#FF0000")
+        border_color = cls.COLORS.get(colors[1] if len(colors) > 1 else "white", "#FFFFFF")
 
         # Draw octagon
         draw.polygon(points, fill=bg_color, outline=border_color, width=10)
 
-    def _draw_triangle(self, draw: ImageDraw, size: int, colors: list):
+    @classmethod
+    def _draw_triangle(cls, draw: ImageDraw, size: int, colors: list):
         """Draw triangular warning sign."""
         padding = 30
         points = [
@@ -101,20 +133,21 @@ class VisualGenerator:
         ]
 
         # Get colors
-        bg_color = self.COLORS.get(colors[1] if len(colors) > 1 else "white", "#FFFFFF")
-        border_color = self.COLORS.get(colors[0] if colors else "red", "#FF0000")
+        bg_color = cls.COLORS.get(colors[1] if len(colors) > 1 else "white", "#FFFFFF")
+        border_color = cls.COLORS.get(colors[0] if colors else "red", "#FF0000")
 
         # Draw triangle
         draw.polygon(points, fill=bg_color, outline=border_color, width=8)
 
-    def _draw_circle(self, draw: ImageDraw, size: int, colors: list):
+    @classmethod
+    def _draw_circle(cls, draw: ImageDraw, size: int, colors: list):
         """Draw circular sign."""
         padding = 30
         bbox = [padding, padding, size - padding, size - padding]
 
         # Get colors
-        bg_color = self.COLORS.get(colors[1] if len(colors) > 1 else "white", "#FFFFFF")
-        border_color = self.COLORS.get(colors[0] if colors else "red", "#FF0000")
+        bg_color = cls.COLORS.get(colors[1] if len(colors) > 1 else "white", "#FFFFFF")
+        border_color = cls.COLORS.get(colors[0] if colors else "red", "#FF0000")
 
         # Draw circle
         draw.ellipse(bbox, fill=bg_color, outline=border_color, width=8)
@@ -130,29 +163,27 @@ class VisualGenerator:
                 width=8,
             )
 
-    def _draw_rectangle(self, draw: ImageDraw, size: int, colors: list):
+    @classmethod
+    def _draw_rectangle(cls, draw: ImageDraw, size: int, colors: list):
         """Draw rectangular informatory sign."""
         padding = 30
         bbox = [padding, size // 4, size - padding, 3 * size // 4]
 
         # Get colors
-        bg_color = self.COLORS.get(colors[0] if colors else "blue", "#0000FF")
-        text_color = self.COLORS.get(colors[1] if len(colors) > 1 else "white", "#FFFFFF")
+        bg_color = cls.COLORS.get(colors[0] if colors else "blue", "#0000FF")
+        text_color = cls.COLORS.get(colors[1] if len(colors) > 1 else "white", "#FFFFFF")
 
         # Draw rectangle
         draw.rectangle(bbox, fill=bg_color, outline=text_color, width=5)
 
-    def _add_text(self, draw: ImageDraw, size: int, text: str, colors: list):
+    @classmethod
+    def _add_text(cls, draw: ImageDraw, size: int, text: str, colors: list):
         """Add text to sign."""
         try:
-            # Try to use a better font, fallback to default
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf", 60)
-            except:
-                font = ImageFont.load_default()
+            font = _FONT_TITLE
 
             # Get text color
-            text_color = self.COLORS.get(colors[1] if len(colors) > 1 else "white", "#FFFFFF")
+            text_color = cls.COLORS.get(colors[1] if len(colors) > 1 else "white", "#FFFFFF")
 
             # Get text bounding box
             bbox = draw.textbbox((0, 0), text, font=font)
@@ -169,83 +200,98 @@ class VisualGenerator:
         except Exception as e:
             logger.warning(f"Could not add text: {e}")
 
-    def _add_dimension_label(self, draw: ImageDraw, size: int, dimensions: str):
+    @classmethod
+    def _add_dimension_label(cls, draw: ImageDraw, size: int, dimensions: str):
         """Add dimension label at bottom."""
         try:
-            try:
-                font = ImageFont.truetype("/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf", 16)
-            except:
-                font = ImageFont.load_default()
-
             text = f"Dimensions: {dimensions[:50]}"
-            draw.text((10, size - 25), text, fill="#666666", font=font)
+            draw.text((10, size - 25), text, fill="#666666", font=_FONT_LABEL)
 
         except Exception as e:
             logger.warning(f"Could not add dimension label: {e}")
 
-    def _image_to_base64(self, img: Image) -> str:
+    @staticmethod
+    def _image_to_base64(img: Image, image_format: str) -> str:
         """Convert PIL Image to base64 string."""
         buffer = io.BytesIO()
-        img.save(buffer, format="PNG")
-        buffer.seek(0)
-        img_base64 = base64.b64encode(buffer.read()).decode()
-        return f"data:image/png;base64,{img_base64}"
+
+        if image_format == "webp":
+            img.save(buffer, format="WEBP", quality=90, method=6)
+            mime = "image/webp"
+        else:
+            # Signs use only a handful of colours, so a small palette is lossless in practice
+            img = img.convert("P", palette=Image.ADAPTIVE, colors=16)
+            img.save(buffer, format="PNG", optimize=True)
+            mime = "image/png"
+
+        img_base64 = base64.b64encode(buffer.getvalue()).decode()
+        return f"data:{mime};base64,{img_base64}"
 
     def generate_road_marking_diagram(
         self, marking_type: str, colors: list, dimensions: str, size: Tuple[int, int] = (600, 200)
     ) -> str:
         """Generate road marking diagram."""
         try:
-            img = Image.new("RGB", size, "#333333")  # Dark gray road
-            draw = ImageDraw.Draw(img)
-
-            if "broken" in marking_type.lower() or "dashed" in marking_type.lower():
-                self._draw_broken_line(draw, size, colors)
-            elif "continuous" in marking_type.lower() or "solid" in marking_type.lower():
-                self._draw_continuous_line(draw, size, colors)
-            elif "arrow" in marking_type.lower():
-                self._draw_arrow(draw, size, colors)
-            elif "zebra" in marking_type.lower() or "crossing" in marking_type.lower():
-                self._draw_zebra_crossing(draw, size, colors)
-            elif "chevron" in marking_type.lower():
-                self._draw_chevron(draw, size, colors)
-            else:
-                self._draw_continuous_line(draw, size, colors)
-
-            # Add dimension label
-            if dimensions:
-                self._add_dimension_label(draw, size[0], dimensions)
-
-            return self._image_to_base64(img)
-
+            return self._render_road_marking(self.image_format, marking_type, tuple(colors), dimensions, tuple(size))
         except Exception as e:
             logger.error(f"Error generating road marking: {e}")
             return ""
 
-    def _draw_broken_line(self, draw: ImageDraw, size: Tuple[int, int], colors: list):
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _render_road_marking(
+        cls, image_format: str, marking_type: str, colors: tuple, dimensions: str, size: Tuple[int, int]
+    ) -> str:
+        """Render a road marking diagram; memoized on the (hashable) inputs, so failures raise rather than cache."""
+        img = Image.new("RGB", size, "#333333")  # Dark gray road
+        draw = ImageDraw.Draw(img)
+
+        if "broken" in marking_type.lower() or "dashed" in marking_type.lower():
+            cls._draw_broken_line(draw, size, colors)
+        elif "continuous" in marking_type.lower() or "solid" in marking_type.lower():
+            cls._draw_continuous_line(draw, size, colors)
+        elif "arrow" in marking_type.lower():
+            cls._draw_arrow(draw, size, colors)
+        elif "zebra" in marking_type.lower() or "crossing" in marking_type.lower():
+            cls._draw_zebra_crossing(draw, size, colors)
+        elif "chevron" in marking_type.lower():
+            cls._draw_chevron(draw, size, colors)
+        else:
+            cls._draw_continuous_line(draw, size, colors)
+
+        # Add dimension label
+        if dimensions:
+            cls._add_dimension_label(draw, size[0], dimensions)
+
+        return cls._image_to_base64(img, image_format)
+
+    @classmethod
+    def _draw_broken_line(cls, draw: ImageDraw, size: Tuple[int, int], colors: list):
         """Draw broken/dashed line."""
         y = size[1] // 2
         dash_length = 40
         gap_length = 20
         x = 50
 
-        color = self.COLORS.get(colors[0] if colors else "white", "#FFFFFF")
+        color = cls.COLORS.get(colors[0] if colors else "white", "#FFFFFF")
 
         while x < size[0] - 50:
             draw.line([(x, y), (x + dash_length, y)], fill=color, width=8)
             x += dash_length + gap_length
 
-    def _draw_continuous_line(self, draw: ImageDraw, size: Tuple[int, int], colors: list):
+    @classmethod
+    def _draw_continuous_line(cls, draw: ImageDraw, size: Tuple[int, int], colors: list):
         """Draw continuous solid line."""
         y = size[1] // 2
-        color = self.COLORS.get(colors[0] if colors else "white", "#FFFFFF")
+        color = cls.COLORS.get(colors[0] if colors else "white", "#FFFFFF")
         draw.line([(50, y), (size[0] - 50, y)], fill=color, width=8)
 
-    def _draw_arrow(self, draw: ImageDraw, size: Tuple[int, int], colors: list):
+    @classmethod
+    def _draw_arrow(cls, draw: ImageDraw, size: Tuple[int, int], colors: list):
         """Draw arrow marking."""
         center_x = size[0] // 2
         center_y = size[1] // 2
-        color = self.COLORS.get(colors[0] if colors else "white", "#FFFFFF")
+        color = cls.COLORS.get(colors[0] if colors else "white", "#FFFFFF")
 
         # Arrow shaft
         draw.line([(center_x, center_y + 40), (center_x, center_y - 30)], fill=color, width=12)
@@ -254,21 +300,23 @@ class VisualGenerator:
         points = [(center_x, center_y - 40), (center_x - 25, center_y - 10), (center_x + 25, center_y - 10)]
         draw.polygon(points, fill=color)
 
-    def _draw_zebra_crossing(self, draw: ImageDraw, size: Tuple[int, int], colors: list):
+    @classmethod
+    def _draw_zebra_crossing(cls, draw: ImageDraw, size: Tuple[int, int], colors: list):
         """Draw zebra crossing stripes."""
         stripe_width = 30
         gap = 10
         x = 50
-        color = self.COLORS.get(colors[0] if colors else "white", "#FFFFFF")
+        color = cls.COLORS.get(colors[0] if colors else "white", "#FFFFFF")
 
         while x < size[0] - 50:
             draw.rectangle([x, 50, x + stripe_width, size[1] - 50], fill=color)
             x += stripe_width + gap
 
-    def _draw_chevron(self, draw: ImageDraw, size: Tuple[int, int], colors: list):
+    @classmethod
+    def _draw_chevron(cls, draw: ImageDraw, size: Tuple[int, int], colors: list):
         """Draw chevron marking."""
         center_y = size[1] // 2
-        color = self.COLORS.get(colors[0] if colors else "white", "#FFFFFF")
+        color = cls.COLORS.get(colors[0] if colors else "white", "#FFFFFF")
 
         # Draw multiple chevrons
         for x in range(100, size[0] - 100, 150):
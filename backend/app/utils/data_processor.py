@@ -1,7 +1,11 @@
 """Data processing utilities for cleaning and enriching intervention data."""
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import io
 import re
-import json
+from collections import Counter
+import orjson
 from pathlib import Path
 from typing import List, Dict, Optional, Tuple
 import logging
@@ -19,8 +23,41 @@ class DataProcessor:
         "Low": ["wrongly placed", "non-retroreflective"],
     }
 
+    # One alternation per priority tier
+    PRIORITY_PATTERNS = {
+        priority: re.compile("|".join(map(re.escape, keywords)))
+        for priority, keywords in PRIORITY_KEYWORDS.items()
+    }
+
     COLORS = ["red", "white", "yellow", "black", "blue", "green", "orange"]
 
+    KEYWORD_PATTERN = re.compile(r"\b[a-z]{4,}\b")
+
+    STOP_WORDS = frozenset(
+        ["the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by", "is", "are", "be", "shall"]
+    )
+
+    # Low-cardinality text columns stored as pandas categoricals
+    CATEGORICAL_COLUMNS = ["category", "problem", "code", "clause"]
+
+    # Speed patterns in match order, with how each maps to (min, max)
+    SPEED_PATTERNS = [
+        (re.compile(r"(\d+)\s*-\s*(\d+)\s*km[/h]", re.IGNORECASE), "range"),  # 51-65 km/h
+        (re.compile(r"up\s+to\s+(\d+)\s*km[/h]", re.IGNORECASE), "single"),  # up to 50 km/h
+        (re.compile(r"over\s+(\d+)\s*km[/h]", re.IGNORECASE), "over"),  # over 65 km/h
+        (re.compile(r"(\d+)\s*km[/h]", re.IGNORECASE), "single"),  # 50 km/h
+    ]
+
+    DIMENSION_PATTERN = re.compile(
+        r"\d+\.?\d*\s*(?:mm|m|km|cm)(?:\s*x\s*\d+\.?\d*\s*(?:mm|m|km|cm))?", re.IGNORECASE
+    )
+
+    PLACEMENT_PATTERN = re.compile(
+        r"\d+\.?\d*\s*-?\s*\d*\.?\d*\s*[km]?\s*(?:m|meters?)\s+(?:from|away|ahead|before)", re.IGNORECASE
+    )
+
+    MAX_SPEED = 200  # Upper bound assumed for "over N km/h"
+
     def __init__(self, csv_path: Path):
         """Initialize data processor."""
         self.csv_path = csv_path
@@ -33,11 +70,22 @@ class DataProcessor:
 
         for encoding in encodings:
             try:
-                df = pd.read_csv(self.csv_path, encoding=encoding)
+                table = pacsv.read_csv(
+                    self.csv_path,
+                    read_options=pacsv.ReadOptions(encoding=encoding),
+                    parse_options=pacsv.ParseOptions(newlines_in_values=True),
+                    convert_options=pacsv.ConvertOptions(strings_can_be_null=True),
+                )
+                # Arrow infers binary columns for text that isn't valid in this encoding
+                if any(pa.types.is_binary(field.type) for field in table.schema):
+                    continue
+
+                # Empty cells come back as None; use NaN like pandas' reader
+                df = table.to_pandas().replace({None: float("nan")})
                 logger.info(f"Successfully loaded CSV with {encoding} encoding")
                 self.df = df
                 return df
-            except UnicodeDecodeError:
+            except (UnicodeDecodeError, pa.ArrowInvalid):
                 continue
             except Exception as e:
                 logger.error(f"Error loading CSV with {encoding}: {e}")
@@ -50,7 +98,7 @@ class DataProcessor:
         if self.df is None:
             raise ValueError("Data not loaded. Call load_csv() first")
 
-        df = self.df.copy()
+        df = self.df.copy(deep=False)
 
         # Standardize column names
         df.columns = df.columns.str.strip()
@@ -79,9 +127,16 @@ class DataProcessor:
         if removed > 0:
             self.issues.append(f"Removed {removed} rows with insufficient data")
 
+        # Categories in order of first appearance, so value_counts ties keep file order
+        for col in self.CATEGORICAL_COLUMNS:
+            df[col] = df[col].astype(pd.CategoricalDtype(df[col].unique()))
+
         # Fix malformed rows (merge multi-line entries)
         df = self._fix_multiline_entries(df)
 
+        for col in self.CATEGORICAL_COLUMNS:
+            df[col] = df[col].cat.remove_unused_categories()
+
         self.df = df
         logger.info(f"Cleaned data: {len(df)} rows")
         return df
@@ -92,29 +147,20 @@ class DataProcessor:
         # it might be a broken row. For now, we'll keep valid rows only.
 
         valid_categories = ["Road Sign", "Road Marking", "Traffic Calming Measures"]
-        df = df[df["category"].isin(valid_categories)]
+        df = df[df["category"].isin(valid_categories)]  # Compares category codes, not strings
 
         return df
 
     def extract_speed_range(self, text: str) -> Tuple[Optional[int], Optional[int]]:
         """Extract speed range from text."""
         # Patterns: "50 km/h", "51-65 km/h", "up to 50 km/h", "over 65 km/h"
-        patterns = [
-            r"(\d+)\s*-\s*(\d+)\s*km[/h]",  # 51-65 km/h
-            r"up\s+to\s+(\d+)\s*km[/h]",  # up to 50 km/h
-            r"over\s+(\d+)\s*km[/h]",  # over 65 km/h
-            r"(\d+)\s*km[/h]",  # 50 km/h
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern, kind in self.SPEED_PATTERNS:
+            match = pattern.search(text)
             if match:
-                if len(match.groups()) == 2:
+                if kind == "range":
                     return int(match.group(1)), int(match.group(2))
-                elif "up to" in pattern:
-                    return 0, int(match.group(1))
-                elif "over" in pattern:
-                    return int(match.group(1)), 200  # Max speed assumption
+                elif kind == "over":
+                    return int(match.group(1)), self.MAX_SPEED
                 else:
                     speed = int(match.group(1))
                     return speed, speed
@@ -124,9 +170,7 @@ class DataProcessor:
     def extract_dimensions(self, text: str) -> List[str]:
         """Extract dimensions from text."""
         # Patterns: "900 mm", "1.5 m", "600mm x 800mm"
-        pattern = r"\d+\.?\d*\s*(?:mm|m|km|cm)(?:\s*x\s*\d+\.?\d*\s*(?:mm|m|km|cm))?"
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        return matches[:5]  # Limit to 5 dimensions
+        return self.DIMENSION_PATTERN.findall(text)[:5]  # Limit to 5 dimensions
 
     def extract_colors(self, text: str) -> List[str]:
         """Extract colors from text."""
@@ -142,9 +186,42 @@ class DataProcessor:
     def extract_placement_distances(self, text: str) -> List[str]:
         """Extract placement distances."""
         # Patterns: "45m from", "1.5 m from", "5-6 m away"
-        pattern = r"\d+\.?\d*\s*-?\s*\d*\.?\d*\s*[km]?\s*(?:m|meters?)\s+(?:from|away|ahead|before)"
-        matches = re.findall(pattern, text, re.IGNORECASE)
-        return matches[:3]
+        return self.PLACEMENT_PATTERN.findall(text)[:3]
+
+    def _extract_speed_ranges(self, data: pd.Series) -> Tuple[pd.Series, pd.Series]:
+        """Vectorized extract_speed_range over a Series of texts."""
+        speed_min = pd.Series(float("nan"), index=data.index)
+        speed_max = pd.Series(float("nan"), index=data.index)
+        unmatched = pd.Series(True, index=data.index)
+
+        # First matching pattern wins, as in extract_speed_range
+        for pattern, kind in self.SPEED_PATTERNS:
+            groups = data.str.extract(pattern).astype(float)
+            hit = unmatched & groups[0].notna()
+
+            low = groups[0]
+            if kind == "range":
+                high = groups[1]
+            elif kind == "over":
+                high = pd.Series(float(self.MAX_SPEED), index=data.index)
+            else:
+                high = low
+
+            speed_min[hit] = low[hit]
+            speed_max[hit] = high[hit]
+            unmatched &= ~hit
+
+        return speed_min, speed_max
+
+    def _extract_colors(self, data: pd.Series) -> pd.Series:
+        """Vectorized extract_colors over a Series of texts."""
+        data_lower = data.str.lower()
+        masks = [data_lower.str.contains(color, regex=False).to_numpy() for color in self.COLORS]
+        return pd.Series(
+            [[color for color, hit in zip(self.COLORS, row) if hit] for row in zip(*masks)],
+            index=data.index,
+            dtype=object,
+        )
 
     def assign_priority(self, row: pd.Series) -> str:
         """Assign priority based on problem and content."""
@@ -157,39 +234,35 @@ class DataProcessor:
 
         return "Medium"  # Default
 
+    def _assign_priorities(self, df: pd.DataFrame) -> pd.Series:
+        """Vectorized assign_priority over a DataFrame."""
+        text = (df["problem"].astype(str) + " " + df["type"] + " " + df["data"]).str.lower()
+        priority = pd.Series("Medium", index=df.index)
+
+        # Apply tiers lowest first so the highest matching tier wins, as in assign_priority
+        for tier in reversed(list(self.PRIORITY_KEYWORDS)):
+            priority[text.str.contains(self.PRIORITY_PATTERNS[tier])] = tier
+
+        return priority
+
     def extract_keywords(self, text: str) -> List[str]:
         """Extract relevant keywords from text."""
         # Remove common words and extract meaningful terms
-        stop_words = {
-            "the",
-            "a",
-            "an",
-            "and",
-            "or",
-            "but",
-            "in",
-            "on",
-            "at",
-            "to",
-            "for",
-            "of",
-            "with",
-            "by",
-            "is",
-            "are",
-            "be",
-            "shall",
-        }
-
-        words = re.findall(r"\b[a-z]{4,}\b", text.lower())
-        keywords = [w for w in words if w not in stop_words]
+        words = self.KEYWORD_PATTERN.findall(text.lower())
+        keywords = [w for w in words if w not in self.STOP_WORDS]
 
         # Count frequency and return top keywords
-        from collections import Counter
-
         counter = Counter(keywords)
         return [word for word, _ in counter.most_common(10)]
 
+    def _extract_keywords(self, data: pd.Series) -> pd.Series:
+        """Vectorized extract_keywords over a Series of texts."""
+        tokens = data.str.lower().str.findall(self.KEYWORD_PATTERN).explode()
+        tokens = tokens[tokens.notna() & ~tokens.isin(self.STOP_WORDS)]
+
+        top = tokens.groupby(level=0, sort=False).agg(lambda words: [w for w, _ in Counter(words).most_common(10)])
+        return top.reindex(data.index).apply(lambda words: words if isinstance(words, list) else [])
+
     def create_search_text(self, row: pd.Series) -> str:
         """Create concatenated searchable text."""
         parts = [
@@ -206,32 +279,39 @@ class DataProcessor:
         if self.df is None:
             raise ValueError("Data not loaded and cleaned")
 
-        df = self.df.copy()
+        df = self.df.copy(deep=False)
 
         # Generate unique IDs
-        df["id"] = df.apply(
-            lambda row: f"{row['category'][:2].upper()}{row['problem'][:2].upper()}_{row.name + 1:03d}",
-            axis=1,
+        df["id"] = (
+            df["category"].str[:2].str.upper()
+            + df["problem"].str[:2].str.upper()
+            + "_"
+            + (df.index.to_series() + 1).map("{:03d}".format)
         )
 
         # Extract speed ranges
-        speed_ranges = df["data"].apply(self.extract_speed_range)
-        df["speed_min"] = speed_ranges.apply(lambda x: x[0])
-        df["speed_max"] = speed_ranges.apply(lambda x: x[1])
+        df["speed_min"], df["speed_max"] = self._extract_speed_ranges(df["data"])
 
         # Extract other features
-        df["dimensions"] = df["data"].apply(self.extract_dimensions)
-        df["colors"] = df["data"].apply(self.extract_colors)
-        df["placement_distances"] = df["data"].apply(self.extract_placement_distances)
+        df["dimensions"] = df["data"].str.findall(self.DIMENSION_PATTERN).str[:5]
+        df["colors"] = self._extract_colors(df["data"])
+        df["placement_distances"] = df["data"].str.findall(self.PLACEMENT_PATTERN).str[:3]
 
         # Assign priority
-        df["priority"] = df.apply(self.assign_priority, axis=1)
+        priority = self._assign_priorities(df)
+        df["priority"] = priority.astype(pd.CategoricalDtype(priority.unique()))
 
         # Extract keywords
-        df["keywords"] = df["data"].apply(self.extract_keywords)
+        df["keywords"] = self._extract_keywords(df["data"])
 
         # Create search text
-        df["search_text"] = df.apply(self.create_search_text, axis=1)
+        df["search_text"] = (
+            "Problem: " + df["problem"].astype(str)
+            + " Category: " + df["category"].astype(str)
+            + " Type: " + df["type"]
+            + " Details: " + df["data"]
+            + " Standard: " + df["code"].astype(str) + " " + df["clause"].astype(str)
+        )
 
         self.df = df
         logger.info(f"Enriched data with {len(df.columns)} columns")
@@ -249,23 +329,16 @@ class DataProcessor:
         json_path = output_dir / "interventions.json"
         records = self.df.to_dict(orient="records")
 
-        # Convert lists to JSON-serializable format
-        for record in records:
-            for key, value in record.items():
-                if isinstance(value, list):
-                    record[key] = value
-                elif pd.isna(value):
-                    record[key] = None
-
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(records, f, indent=2, ensure_ascii=False)
+        # orjson writes NaN as null and handles numpy scalars natively
+        with open(json_path, "wb") as f:
+            f.write(orjson.dumps(records, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
 
         saved_files["json"] = json_path
         logger.info(f"Saved JSON to {json_path}")
 
         # Save as cleaned CSV
         csv_path = output_dir / "interventions_cleaned.csv"
-        self.df.to_csv(csv_path, index=False, encoding="utf-8")
+        pacsv.write_csv(self._to_arrow_table(self.df), csv_path)
         saved_files["csv"] = csv_path
         logger.info(f"Saved CSV to {csv_path}")
 
@@ -276,49 +349,65 @@ class DataProcessor:
 
         return saved_files
 
+    @staticmethod
+    def _to_arrow_table(df: pd.DataFrame) -> pa.Table:
+        """Convert to an Arrow table the CSV writer accepts."""
+        columns = {}
+        for col in df.columns:
+            series = df[col]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                # The CSV writer has no dictionary support
+                series = series.astype(object)
+            elif series.dtype == object and series.map(lambda v: isinstance(v, (list, tuple))).any():
+                # Same text pandas' to_csv emits for list cells
+                series = series.map(lambda v: str(v) if isinstance(v, (list, tuple)) else v)
+            columns[col] = series
+
+        return pa.Table.from_pandas(pd.DataFrame(columns), preserve_index=False)
+
     def _save_quality_report(self, report_path: Path):
         """Save data quality report."""
         if self.df is None:
             return
 
-        report = []
-        report.append("=" * 60)
-        report.append("DATA QUALITY REPORT")
-        report.append("=" * 60)
-        report.append("")
+        report = io.StringIO()
+        print("=" * 60, file=report)
+        print("DATA QUALITY REPORT", file=report)
+        print("=" * 60, file=report)
+        print(file=report)
 
-        report.append(f"Total Records: {len(self.df)}")
-        report.append(f"Total Columns: {len(self.df.columns)}")
-        report.append("")
+        print(f"Total Records: {len(self.df)}", file=report)
+        print(f"Total Columns: {len(self.df.columns)}", file=report)
+        print(file=report)
 
-        report.append("Categories:")
+        print("Categories:", file=report)
         for cat, count in self.df["category"].value_counts().items():
-            report.append(f"  - {cat}: {count}")
-        report.append("")
+            print(f"  - {cat}: {count}", file=report)
+        print(file=report)
 
-        report.append("Problem Types:")
+        print("Problem Types:", file=report)
         for prob, count in self.df["problem"].value_counts().items():
-            report.append(f"  - {prob}: {count}")
-        report.append("")
+            print(f"  - {prob}: {count}", file=report)
+        print(file=report)
 
-        report.append("IRC Standards:")
+        print("IRC Standards:", file=report)
         for code in self.df["code"].unique():
             if code:
-                report.append(f"  - {code}")
-        report.append("")
+                print(f"  - {code}", file=report)
+        print(file=report)
 
         if self.issues:
-            report.append("Issues Found and Fixed:")
+            print("Issues Found and Fixed:", file=report)
             for issue in self.issues:
-                report.append(f"  - {issue}")
+                print(f"  - {issue}", file=report)
         else:
-            report.append("No issues found during processing")
+            print("No issues found during processing", file=report)
 
-        report.append("")
-        report.append("=" * 60)
+        print(file=report)
+        report.write("=" * 60)
 
         with open(report_path, "w") as f:
-            f.write("\n".join(report))
+            f.write(report.getvalue())
 
         logger.info(f"Saved quality report to {report_path}")
 
@@ -1,103 +1,109 @@
 """Helper utility functions."""
+import asyncio
 import time
 import hashlib
-from typing import Any, Dict
-from functools import wraps
+import re
+from typing import TYPE_CHECKING, Any, Dict
+from functools import lru_cache, wraps
 import logging
 
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger(__name__)
 
+# Maintenance-related keywords, matched at the start of a word ("years" but not "halfyearly")
+_MAINTENANCE_KEYWORDS = ["replace", "maintain", "inspect", "warranty", "reflectivity", "year", "month"]
+_MAINTENANCE_PATTERN = re.compile(r"\b(?:" + "|".join(_MAINTENANCE_KEYWORDS) + ")", re.IGNORECASE)
+
+# Cost estimates by (problem, category)
+_COST_MATRIX = {
+    ("Damaged", "Road Sign"): "Medium (₹2,000 - ₹5,000)",
+    ("Faded", "Road Sign"): "Medium (₹2,500 - ₹4,000)",
+    ("Missing", "Road Sign"): "Medium (₹3,000 - ₹6,000)",
+    ("Damaged", "Road Marking"): "Low (₹500 - ₹2,000)",
+    ("Faded", "Road Marking"): "Low (₹800 - ₹2,500)",
+    ("Missing", "Road Marking"): "Medium (₹2,000 - ₹4,000)",
+    ("Damaged", "Traffic Calming Measures"): "High (₹10,000 - ₹25,000)",
+    ("Missing", "Traffic Calming Measures"): "High (₹15,000 - ₹30,000)",
+}
+
+# Default estimates by category
+_CATEGORY_COST_DEFAULTS = {
+    "Road Sign": "Medium (₹2,000 - ₹5,000)",
+    "Road Marking": "Low (₹1,000 - ₹3,000)",
+    "Traffic Calming Measures": "High (₹12,000 - ₹28,000)",
+}
+
+# Installation time by category
+_INSTALLATION_TIMES = {
+    "Road Sign": "2-4 hours",
+    "Road Marking": "4-8 hours",
+    "Traffic Calming Measures": "1-3 days",
+}
+
 
 def timer(func):
     """Decorator to time function execution."""
+    if asyncio.iscoroutinefunction(func):
 
-    @wraps(func)
-    async def async_wrapper(*args, **kwargs):
-        start = time.time()
-        result = await func(*args, **kwargs)
-        elapsed = int((time.time() - start) * 1000)
-        logger.debug(f"{func.__name__} took {elapsed}ms")
-        return result
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            result = await func(*args, **kwargs)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s took %dms", func.__name__, (time.perf_counter() - start) * 1000)
+            return result
+
+        return async_wrapper
 
     @wraps(func)
     def sync_wrapper(*args, **kwargs):
-        start = time.time()
+        start = time.perf_counter()
         result = func(*args, **kwargs)
-        elapsed = int((time.time() - start) * 1000)
-        logger.debug(f"{func.__name__} took {elapsed}ms")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s took %dms", func.__name__, (time.perf_counter() - start) * 1000)
         return result
 
-    import asyncio
-
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper
     return sync_wrapper
 
 
 def generate_cache_key(query: str, filters: Dict[str, Any] = None) -> str:
     """Generate cache key from query and filters."""
-    key_data = {"query": query.lower().strip()}
+    # bytes.lower()/strip() are ASCII-only C loops; non-ASCII case variants just miss the cache
+    key = query.encode("utf-8", "surrogatepass").lower().strip()
 
     if filters:
-        key_data["filters"] = str(sorted(filters.items()))
+        # Unit-separator byte keeps {"a": "b=c"} and {"a=b": "c"} distinct
+        key += b"".join(
+            b"\x1f" + name.encode("utf-8") + b"=" + repr(filters[name]).encode("utf-8") for name in sorted(filters)
+        )
 
-    key_string = str(key_data)
-    return hashlib.md5(key_string.encode()).hexdigest()
+    # One-shot digest: hash the assembled key in the constructor rather than via update()
+    return hashlib.blake2b(key, digest_size=16).hexdigest()
 
 
+@lru_cache(maxsize=64)
 def estimate_cost(problem: str, category: str) -> str:
     """Estimate implementation cost based on problem and category."""
-    cost_matrix = {
-        ("Damaged", "Road Sign"): "Medium (₹2,000 - ₹5,000)",
-        ("Faded", "Road Sign"): "Medium (₹2,500 - ₹4,000)",
-        ("Missing", "Road Sign"): "Medium (₹3,000 - ₹6,000)",
-        ("Damaged", "Road Marking"): "Low (₹500 - ₹2,000)",
-        ("Faded", "Road Marking"): "Low (₹800 - ₹2,500)",
-        ("Missing", "Road Marking"): "Medium (₹2,000 - ₹4,000)",
-        ("Damaged", "Traffic Calming Measures"): "High (₹10,000 - ₹25,000)",
-        ("Missing", "Traffic Calming Measures"): "High (₹15,000 - ₹30,000)",
-    }
-
-    # Default estimates by category
-    category_defaults = {
-        "Road Sign": "Medium (₹2,000 - ₹5,000)",
-        "Road Marking": "Low (₹1,000 - ₹3,000)",
-        "Traffic Calming Measures": "High (₹12,000 - ₹28,000)",
-    }
-
-    return cost_matrix.get((problem, category), category_defaults.get(category, "Medium"))
+    return _COST_MATRIX.get((problem, category), _CATEGORY_COST_DEFAULTS.get(category, "Medium"))
 
 
+@lru_cache(maxsize=8)
 def estimate_installation_time(category: str, problem: str) -> str:
     """Estimate installation time."""
-    time_matrix = {
-        "Road Sign": "2-4 hours",
-        "Road Marking": "4-8 hours",
-        "Traffic Calming Measures": "1-3 days",
-    }
-
-    return time_matrix.get(category, "Variable")
+    return _INSTALLATION_TIMES.get(category, "Variable")
 
 
 def extract_maintenance_info(data: str) -> str:
     """Extract maintenance information from intervention data."""
-    # Look for maintenance-related keywords
-    maintenance_keywords = [
-        "replace",
-        "maintain",
-        "inspect",
-        "warranty",
-        "reflectivity",
-        "year",
-        "month",
-    ]
-
-    sentences = data.split(".")
-    for sentence in sentences:
-        sentence_lower = sentence.lower()
-        if any(keyword in sentence_lower for keyword in maintenance_keywords):
-            # Found a maintenance-related sentence
-            return sentence.strip()
+    # Single pass over the text for the first maintenance keyword
+    match = _MAINTENANCE_PATTERN.search(data)
+    if match:
+        # Return the "."-delimited sentence containing it
+        start = data.rfind(".", 0, match.start()) + 1
+        end = data.find(".", match.end())
+        return data[start : end if end != -1 else None].strip()
 
     # Default maintenance schedules
     return "Inspect annually and replace when deteriorated"
@@ -110,6 +116,12 @@ def truncate_text(text: str, max_length: int = 500) -> str:
     return text[:max_length - 3] + "..."
 
 
+def truncate_series(texts: "pd.Series", max_length: int = 500) -> "pd.Series":
+    """Vectorized truncate_text over a Series of strings."""
+    too_long = texts.str.len() > max_length
+    return texts.where(~too_long, texts.str.slice(0, max_length - 3) + "...")
+
+
 def format_irc_reference(code: str, clause: str) -> str:
     """Format IRC reference string."""
     if code and clause:
@@ -3,11 +3,15 @@ import sys
 import asyncio
 from pathlib import Path
 
+import numpy as np
+import pandas as pd
+
 # Add parent directory to path
 sys.path.append(str(Path(__file__).parent.parent.parent))
 
 from backend.app.config import settings
 from backend.app.utils.data_processor import DataProcessor
+from backend.app.utils.helpers import truncate_series
 from backend.app.services.gemini_service import GeminiService
 from backend.app.services.vector_store import VectorStoreService
 import logging
@@ -18,6 +22,9 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Documents embedded and written to the vector store per round trip
+EMBEDDING_CHUNK_SIZE = 256
+
 
 async def main():
     """Main setup function."""
@@ -49,67 +56,88 @@ async def main():
         for file_type, file_path in saved_files.items():
             logger.info(f"Saved {file_type}: {file_path}")
 
-        # Step 3: Generate embeddings
-        logger.info("\n[3/4] Generating embeddings with Gemini...")
+        # Step 3: Prepare documents
+        logger.info("\n[3/4] Preparing documents for embedding...")
 
         gemini_service = GeminiService()
 
-        # Prepare documents
-        documents = []
-        metadatas = []
-        ids = []
-
-        for idx, row in df.iterrows():
-            # Create document text
-            doc_text = row.get("search_text", "")
-            if not doc_text:
-                doc_text = f"{row['problem']} {row['category']} {row['type']} {row['data']}"
-
-            documents.append(doc_text)
-
-            # Create metadata (ChromaDB only supports simple types)
-            metadata = {
-                "id": row["id"],
-                "s_no": int(row["S. No."]) if "S. No." in row else int(row["s_no"]) if "s_no" in row else 0,
-                "problem": str(row["problem"]),
-                "category": str(row["category"]),
-                "type": str(row["type"]),
-                "code": str(row["code"]),
-                "clause": str(row["clause"]),
-                "data": str(row["data"])[:500],  # Truncate for metadata
+        # Prepare documents, falling back to the raw fields when search text is empty
+        search_text = df["search_text"].fillna("") if "search_text" in df else pd.Series("", index=df.index)
+        fallback_text = (
+            df["problem"].astype(str)
+            + " "
+            + df["category"].astype(str)
+            + " "
+            + df["type"].astype(str)
+            + " "
+            + df["data"].astype(str)
+        )
+        documents = search_text.where(search_text != "", fallback_text).tolist()
+
+        # Create metadata (ChromaDB only supports simple types)
+        s_no_column = "S. No." if "S. No." in df else "s_no" if "s_no" in df else None
+        metadatas = pd.DataFrame(
+            {
+                "id": df["id"],
+                "s_no": df[s_no_column].fillna(0).astype("int64") if s_no_column else 0,
+                "problem": df["problem"].astype(str),
+                "category": df["category"].astype(str),
+                "type": df["type"].astype(str),
+                "code": df["code"].astype(str),
+                "clause": df["clause"].astype(str),
+                "data": truncate_series(df["data"].astype(str), 500),  # Truncate for metadata
             }
-
-            # Add optional fields if available
-            if "speed_min" in row and row["speed_min"] is not None:
-                metadata["speed_min"] = int(row["speed_min"])
-            if "speed_max" in row and row["speed_max"] is not None:
-                metadata["speed_max"] = int(row["speed_max"])
-            if "priority" in row and row["priority"]:
-                metadata["priority"] = str(row["priority"])
-
-            metadatas.append(metadata)
-            ids.append(row["id"])
+        ).to_dict(orient="records")
+
+        # Add optional fields where available; ChromaDB rejects None/NaN values
+        optional_fields = {
+            "speed_min": df["speed_min"].astype("Int64") if "speed_min" in df else None,
+            "speed_max": df["speed_max"].astype("Int64") if "speed_max" in df else None,
+            "priority": df["priority"].astype(object).replace("", None) if "priority" in df else None,
+        }
+        for field, values in optional_fields.items():
+            if values is None:
+                continue
+            for metadata, value in zip(metadatas, values.tolist()):
+                if not pd.isna(value):
+                    metadata[field] = value
+
+        # DataProcessor ids are deterministic per row, so they serve as vector store ids directly
+        if not df["id"].is_unique:
+            duplicates = df.loc[df["id"].duplicated(), "id"].unique().tolist()
+            raise ValueError(f"Duplicate intervention ids: {duplicates[:5]}")
+        ids = df["id"].tolist()
 
         logger.info(f"Prepared {len(documents)} documents for embedding")
 
-        # Generate embeddings in batches
-        logger.info("Generating embeddings (this may take a few minutes)...")
-        embeddings = await gemini_service.generate_embeddings(documents)
-
-        logger.info(f"Generated {len(embeddings)} embeddings")
-
-        # Step 4: Create vector store
-        logger.info("\n[4/4] Creating vector store...")
+        # Step 4: Embed documents into the vector store
+        logger.info("\n[4/4] Generating embeddings with Gemini and building vector store...")
 
-        vector_store = VectorStoreService(
+        if settings.vector_store_backend == "usearch":
+            # Native extension, only needed when the USearch backend is selected
+            from backend.app.services.usearch_store import UsearchVectorStore as vector_store_class
+        else:
+            vector_store_class = VectorStoreService
+        vector_store = vector_store_class(
             persist_directory=str(settings.chroma_dir), collection_name=settings.collection_name
         )
+        vector_store.create_bulk_collection()
 
-        # Create collection
-        vector_store.create_collection()
-
-        # Add documents
-        vector_store.add_documents(documents=documents, embeddings=embeddings, metadatas=metadatas, ids=ids)
+        # Embed and store chunk by chunk so only one chunk of vectors is held at a time;
+        # the bulk collection buffers the chunks into full HNSW batches
+        logger.info("Generating embeddings (this may take a few minutes)...")
+        for start in range(0, len(documents), EMBEDDING_CHUNK_SIZE):
+            end = start + EMBEDDING_CHUNK_SIZE
+            embeddings = np.asarray(
+                await gemini_service.generate_embeddings(documents[start:end]), dtype=np.float32
+            )
+            vector_store.add_documents(
+                documents=documents[start:end], embeddings=embeddings, metadatas=metadatas[start:end], ids=ids[start:end]
+            )
+            logger.info(f"Embedded and stored {min(end, len(documents))}/{len(documents)} documents")
+
+        # Written once after the last chunk rather than per chunk
+        vector_store.persist()
 
         logger.info(f"Vector store created with {vector_store.count()} documents")
 
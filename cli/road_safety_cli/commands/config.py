@@ -11,7 +11,7 @@ console = Console()
 @app.command()
 def set(key: str = typer.Argument(..., help="Config key"), value: str = typer.Argument(..., help="Config value")):
     """Set configuration value."""
-    config = ConfigManager()
+    config = ConfigManager.instance()
     config.set(key, value)
     console.print(f"[green]✅ Set {key} = {value}[/green]")
 
@@ -19,7 +19,7 @@ def set(key: str = typer.Argument(..., help="Config key"), value: str = typer.Ar
 @app.command()
 def get(key: str = typer.Argument(..., help="Config key")):
     """Get configuration value."""
-    config = ConfigManager()
+    config = ConfigManager.instance()
     value = config.get(key)
 
     if value:
@@ -31,7 +31,7 @@ def get(key: str = typer.Argument(..., help="Config key")):
 @app.command()
 def show():
     """Show all configuration."""
-    config = ConfigManager()
+    config = ConfigManager.instance()
     settings = config.get_all()
 
     if settings:
@@ -56,7 +56,7 @@ def show():
 @app.command()
 def clear():
     """Clear all configuration."""
-    config = ConfigManager()
+    config = ConfigManager.instance()
 
     if typer.confirm("Are you sure you want to clear all configuration?"):
         config.clear()
@@ -1,10 +1,8 @@
 """Interactive mode command."""
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.prompt import Prompt
 from rich.panel import Panel
-from rich.markdown import Markdown
-from ..utils.api_client import get_api_client
 from ..utils.formatters import format_result, format_confidence
 
 app = typer.Typer(help="Interactive mode")
@@ -14,6 +12,10 @@ console = Console()
 @app.command()
 def start():
     """Start interactive mode."""
+    # Deferred so other subcommands don't pay for the HTTP client and markdown parser
+    from rich.markdown import Markdown
+    from ..utils.api_client import get_api_client
+
     console.print(
         Panel(
             "[bold cyan]Road Safety Intervention AI[/bold cyan]\n"
@@ -49,19 +51,20 @@ def start():
             )
 
             if results:
-                for idx, result in enumerate(results, 1):
-                    console.print(
-                        Panel(
-                            f"[bold]{result['title']}[/bold]\n\n"
-                            f"Confidence: {format_confidence(result['confidence'])}\n"
-                            f"Category: {result['category']}\n"
-                            f"Problem: {result['problem']}\n"
-                            f"IRC: {result['irc_reference']['code']} {result['irc_reference']['clause']}\n"
-                            f"Cost: {result['cost_estimate']}",
-                            title=f"Result #{idx}",
-                            border_style="cyan",
-                        )
+                panels = [
+                    Panel(
+                        f"[bold]{result['title']}[/bold]\n\n"
+                        f"Confidence: {format_confidence(result['confidence'])}\n"
+                        f"Category: {result['category']}\n"
+                        f"Problem: {result['problem']}\n"
+                        f"IRC: {result['irc_reference']['code']} {result['irc_reference']['clause']}\n"
+                        f"Cost: {result['cost_estimate']}",
+                        title=f"Result #{idx}",
+                        border_style="cyan",
                     )
+                    for idx, result in enumerate(results, 1)
+                ]
+                console.print(Group(*panels), highlight=False)
 
                 # Show synthesis
                 if response.get("synthesis"):
@@ -1,12 +1,10 @@
 """Search command."""
 import typer
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
-from rich.markdown import Markdown
 from typing import Optional, List
 import json
-from ..utils.api_client import get_api_client
 from ..utils.formatters import format_result, format_confidence
 
 app = typer.Typer(help="Search for interventions")
@@ -25,6 +23,10 @@ def query(
     output_format: str = typer.Option("table", "--format", "-f", help="Output format: table, json, markdown"),
 ):
     """Search for road safety interventions."""
+    # Deferred so other subcommands don't pay for the HTTP client and markdown parser
+    from rich.markdown import Markdown
+    from ..utils.api_client import get_api_client
+
     try:
         client = get_api_client()
 
@@ -61,6 +63,7 @@ def query(
                 console.print("---\n")
 
         else:  # table format
+            renderables = []
             for idx, result in enumerate(results, 1):
                 table = Table(title=f"{idx}. {result['title']}", show_header=False, border_style="cyan")
 
@@ -71,8 +74,10 @@ def query(
                 table.add_row("IRC Reference", f"{result['irc_reference']['code']} {result['irc_reference']['clause']}")
                 table.add_row("Cost Estimate", result["cost_estimate"])
 
-                console.print(table)
-                console.print()
+                renderables.extend([table, ""])
+
+            # One write for all results instead of one per table
+            console.print(Group(*renderables), highlight=False)
 
         # Show synthesis
         if response.get("synthesis"):
@@ -1,8 +1,6 @@
 """Main CLI entry point."""
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from typing import Optional
 from .commands import search, interactive, config
 
 app = typer.Typer(
@@ -22,6 +20,7 @@ app.add_typer(config.app, name="config")
 @app.command()
 def version():
     """Show version information."""
+    from rich.panel import Panel
     from . import __version__
 
     console.print(
@@ -1,20 +1,44 @@
 """API client for CLI."""
-import requests
+import importlib.util
+import json
+import httpx
 from typing import Dict, Any, Optional, List
 from .config_manager import ConfigManager
 
+# HTTP/2 needs the optional h2 package (pip install road-safety-cli[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Faster JSON encode/decode when orjson is installed (pip install road-safety-cli[fast])
+try:
+    import orjson
+
+    json_dumps, json_loads = orjson.dumps, orjson.loads
+except ImportError:
+    json_dumps, json_loads = (lambda obj: json.dumps(obj).encode("utf-8")), json.loads
+
 
 class CLIAPIClient:
     """API client for CLI."""
 
     def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
         """Initialize client."""
-        config = ConfigManager()
+        config = ConfigManager.instance()
 
         self.base_url = base_url or config.get("api_url") or "http://localhost:8000"
         self.api_key = api_key or config.get("api_key") or ""
         self.headers = {"X-API-Key": self.api_key, "Content-Type": "application/json"}
 
+        # Pooled client so repeated searches reuse one (multiplexed, if HTTP/2) connection
+        self.client = httpx.Client(
+            headers=self.headers,
+            timeout=30,
+            transport=httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=4, max_keepalive_connections=1),
+                retries=3,  # Connection failures only
+            ),
+        )
+
     def search(
         self,
         query: str,
@@ -43,10 +67,10 @@ class CLIAPIClient:
         if filters:
             payload["filters"] = filters
 
-        response = requests.post(url, json=payload, headers=self.headers, timeout=30)
+        response = self.client.post(url, content=json_dumps(payload))
         response.raise_for_status()
 
-        return response.json()
+        return json_loads(response.content)
 
 
 def get_api_client() -> CLIAPIClient:
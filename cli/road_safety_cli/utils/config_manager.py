@@ -1,5 +1,6 @@
 """Configuration manager for CLI."""
 import json
+import os
 from pathlib import Path
 from typing import Dict, Any, Optional
 
@@ -7,16 +8,33 @@ from typing import Dict, Any, Optional
 class ConfigManager:
     """Manage CLI configuration."""
 
+    _instance: Optional["ConfigManager"] = None
+
     def __init__(self):
         """Initialize config manager."""
         self.config_dir = Path.home() / ".road-safety-cli"
         self.config_file = self.config_dir / "config.json"
 
-        # Create config directory if it doesn't exist
-        self.config_dir.mkdir(parents=True, exist_ok=True)
+        # Loaded on first access
+        self._config: Optional[Dict[str, Any]] = None
+
+    @classmethod
+    def instance(cls) -> "ConfigManager":
+        """Get the process-wide config manager."""
+        if cls._instance is None:
+            cls._instance = cls()
+        return cls._instance
 
-        # Load config
-        self.config = self._load_config()
+    @property
+    def config(self) -> Dict[str, Any]:
+        """Configuration values, read from file once."""
+        if self._config is None:
+            self._config = self._load_config()
+        return self._config
+
+    @config.setter
+    def config(self, value: Dict[str, Any]):
+        self._config = value
 
     def _load_config(self) -> Dict[str, Any]:
         """Load configuration from file."""
@@ -29,9 +47,13 @@ class ConfigManager:
         return {}
 
     def _save_config(self):
-        """Save configuration to file."""
-        with open(self.config_file, "w") as f:
-            json.dump(self.config, f, indent=2)
+        """Save configuration to file atomically."""
+        # Create config directory if it doesn't exist
+        self.config_dir.mkdir(parents=True, exist_ok=True)
+
+        tmp_file = self.config_file.with_suffix(".json.tmp")
+        tmp_file.write_text(json.dumps(self.config, indent=2))
+        os.replace(tmp_file, self.config_file)
 
     def get(self, key: str) -> Optional[str]:
         """Get configuration value."""
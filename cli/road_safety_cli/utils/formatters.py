@@ -20,17 +20,19 @@ def format_confidence(confidence: float) -> str:
 
 def format_result(result: Dict[str, Any], idx: int) -> str:
     """Format result as markdown."""
-    md = f"## {idx}. {result['title']}\n\n"
-    md += f"**Confidence:** {format_confidence(result['confidence'])}\n\n"
-    md += f"**Category:** {result['category']}\n"
-    md += f"**Problem:** {result['problem']}\n"
-    md += f"**Type:** {result['type']}\n\n"
-    md += f"**IRC Reference:** {result['irc_reference']['code']} {result['irc_reference']['clause']}\n\n"
-    md += f"**Cost Estimate:** {result['cost_estimate']}\n"
-
-    if result.get("installation_time"):
-        md += f"**Installation Time:** {result['installation_time']}\n"
-
-    md += f"\n**Explanation:**\n{result['explanation']}\n"
-
-    return md
+    irc = result["irc_reference"]
+    installation = (
+        f"**Installation Time:** {result['installation_time']}\n" if result.get("installation_time") else ""
+    )
+
+    return (
+        f"## {idx}. {result['title']}\n\n"
+        f"**Confidence:** {format_confidence(result['confidence'])}\n\n"
+        f"**Category:** {result['category']}\n"
+        f"**Problem:** {result['problem']}\n"
+        f"**Type:** {result['type']}\n\n"
+        f"**IRC Reference:** {irc['code']} {irc['clause']}\n\n"
+        f"**Cost Estimate:** {result['cost_estimate']}\n"
+        f"{installation}"
+        f"\n**Explanation:**\n{result['explanation']}\n"
+    )
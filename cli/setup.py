@@ -15,8 +15,12 @@ setup(
     install_requires=[
         "typer[all]>=0.9.0",
         "rich>=13.7.0",
-        "requests>=2.31.0",
+        "httpx>=0.26.0",
     ],
+    extras_require={
+        "http2": ["httpx[http2]>=0.26.0"],
+        "fast": ["orjson>=3.9.0"],
+    },
     entry_points={
         "console_scripts": [
             "road-safety=road_safety_cli.main:app",
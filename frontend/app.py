@@ -1,13 +1,20 @@
 """Road Safety Intervention Chatbot - Streamlit Web App."""
+import hashlib
+import html
 import streamlit as st
-from utils.api_client import APIClient, APIError, NetworkError, ValidationError
-import os
-import json
-import time
+from utils.api_client import DEFAULT_API_KEY, DEFAULT_API_URL, APIClient, APIError, NetworkError, ValidationError
+from utils.helpers import BEST_MATCH_BADGE, IRC_BANNER_TEMPLATE, TOP_RECOMMENDATION_BADGE, get_confidence_badge
+from utils.models import Result, SearchResponse, Specifications
+import logging
+import threading
+import msgspec
+import orjson
+import pandas as pd
+from cachetools import TTLCache
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from dotenv import load_dotenv
 
-load_dotenv()
+logger = logging.getLogger(__name__)
 
 # Page config
 st.set_page_config(
@@ -17,9 +24,9 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS
-st.markdown(
-    """
+# Custom CSS for classes the theme (.streamlit/config.toml) can't express.
+# Re-emitted on every run: Streamlit drops any element a rerun doesn't render again.
+CUSTOM_CSS = """
 <style>
     .main-header {
         font-size: 2.5rem;
@@ -70,6 +77,12 @@ st.markdown(
         display: inline-block;
         margin-bottom: 1rem;
     }
+    .detail-grid {
+        display: grid;
+        grid-template-columns: 1fr 1fr 1fr;
+        gap: 1rem;
+        margin: 1rem 0;
+    }
     .explanation-section {
         background-color: #f8f9fa;
         border-left: 4px solid #667eea;
@@ -77,6 +90,22 @@ st.markdown(
         margin: 1rem 0;
         border-radius: 4px;
     }
+    .irc-banner {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        color: white;
+        padding: 20px;
+        border-radius: 10px;
+        margin: 15px 0;
+    }
+    .irc-banner h3 {
+        color: white;
+        margin: 0;
+    }
+    .irc-banner p {
+        color: white;
+        margin: 5px 0 0 0;
+        font-size: 1.1em;
+    }
     .irc-badge {
         background-color: #e3f2fd;
         color: #1976d2;
@@ -98,142 +127,316 @@ st.markdown(
         padding: 3rem;
         color: #666;
     }
+    .footer {
+        text-align: center;
+        color: #666;
+    }
 </style>
-""",
-    unsafe_allow_html=True,
+"""
+
+st.markdown(CUSTOM_CSS, unsafe_allow_html=True)
+
+
+# Read-only metadata (categories, problems, stats) changes rarely; one TTL for every copy of it
+METADATA_TTL = 300
+
+
+@st.cache_resource(max_entries=8, show_spinner=False)
+def get_api_client(api_url: str, api_key: str, timeout: int = 30) -> APIClient:
+    """Shared API client per config, reused across reruns and sessions."""
+    return APIClient(base_url=api_url, api_key=api_key, timeout=timeout)
+
+
+@st.cache_data(ttl=METADATA_TTL, max_entries=8, show_spinner=False)
+def fetch_stats(api_url: str, api_key: str) -> dict:
+    """Fetch database statistics (cached per API config)."""
+    return get_api_client(api_url, api_key).get_stats()
+
+
+@st.cache_data(ttl=METADATA_TTL, max_entries=8, show_spinner=False)
+def fetch_filter_options(api_url: str, api_key: str) -> tuple:
+    """Fetch categories and problem types concurrently (cached per API config)."""
+    client = get_api_client(api_url, api_key, timeout=3)
+
+    # APIClient is blocking, so overlap the two requests in worker threads
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        categories = executor.submit(client.get_categories)
+        problems = executor.submit(client.get_problems)
+        return categories.result(), problems.result()
+
+
+@st.cache_resource(ttl=METADATA_TTL, max_entries=8, show_spinner=False)
+def prefetch_metadata(api_url: str, api_key: str) -> dict:
+    """Start background fetches of filter options and stats without waiting on them."""
+    client = get_api_client(api_url, api_key, timeout=3)
+    executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="prefetch")
+    futures = {
+        "categories": executor.submit(client.get_categories),
+        "problems": executor.submit(client.get_problems),
+        "stats": executor.submit(client.get_stats),
+    }
+    executor.shutdown(wait=False)
+    return futures
+
+
+def get_prefetched(futures: dict, name: str):
+    """Result of a finished background fetch, or None if it is pending or failed."""
+    future = futures.get(name)
+    if future is None or not future.done() or future.exception() is not None:
+        return None
+    return future.result()
+
+
+@st.cache_resource(show_spinner=False)
+def get_search_cache() -> tuple:
+    """Search responses shared across sessions, and the lock guarding them."""
+    return TTLCache(maxsize=256, ttl=600), threading.Lock()
+
+
+def stream_search(client: APIClient, params: dict, on_result) -> SearchResponse:
+    """Collect a streamed search into a SearchResponse, calling on_result(idx, result) as results arrive."""
+    response = SearchResponse(results=[], metadata={}, query=params["query"])
+    for event, data in client.search_stream(**params):
+        if event == "result":
+            response.results.append(data)
+            on_result(len(response.results), data)
+        elif event == "synthesis":
+            response.synthesis = data
+        elif event == "metadata":
+            response.metadata = data
+    return response
+
+
+# Quick example queries and search strategies offered in the UI
+EXAMPLES = (
+    "Faded STOP sign on 65 kmph highway",
+    "Missing road markings at pedestrian crossing",
+    "Damaged speed breaker on urban road",
+    "Obstruction blocking road sign visibility",
 )
+EXAMPLE_OPTIONS = ("",) + EXAMPLES
+STRATEGIES = ("auto", "hybrid", "rag", "structured")
 
 
-def get_confidence_badge(confidence: float) -> str:
-    """Get confidence badge HTML."""
-    percentage = f"{confidence * 100:.0f}%"
+def format_explanation(result: Result, is_top_recommendation=False) -> str:
+    """Build the explanation component as one markdown/HTML string."""
+    # Blank lines let the markdown inside the wrapper div render
+    parts = ['<div class="explanation-section">']
+    if is_top_recommendation:
+        parts.append(TOP_RECOMMENDATION_BADGE)
+    parts.append("### 💡 Why This Intervention?")
+    parts.append(
+        result.explanation
+        or "This intervention matches your road safety issue based on the IRC standards database."
+    )
+    parts.append("</div>")
+    return "\n\n".join(parts)
 
-    if confidence >= 0.8:
-        badge_class = "high-confidence"
-        stars = "⭐⭐⭐⭐⭐"
-    elif confidence >= 0.6:
-        badge_class = "medium-confidence"
-        stars = "⭐⭐⭐⭐"
-    else:
-        badge_class = "low-confidence"
-        stars = "⭐⭐⭐"
 
-    return f'<span class="confidence-badge {badge_class}">{stars} {percentage}</span>'
+def format_fields(fields) -> str:
+    """Render (label, value) pairs as HTML lines."""
+    return "<br>".join(f"<strong>{label}:</strong> {html.escape(str(value))}" for label, value in fields)
+
+
+def split_specs(specs: Specifications) -> tuple:
+    """Specification (label, value) pairs: the summary fields, then shape and materials."""
+    summary = [
+        ("Dimensions", specs.dimensions),
+        ("Colors", ", ".join(specs.colors) if specs.colors else None),
+        ("Placement", specs.placement),
+    ]
+    extra = [("Shape", specs.shape), ("Materials", specs.materials)]
+    return [field for field in summary if field[1]], [field for field in extra if field[1]]
+
 
+def render_result_html(result: Result, idx, is_top_recommendation=False) -> tuple:
+    """Markdown/HTML for a result: header (title, badges, IRC banner), body (explanation, detail grid), full specs."""
+    irc_code = result.irc_reference.code
+    spec_summary, spec_extra = split_specs(result.specifications)
 
-def display_explanation(result, is_top_recommendation=False):
-    """Display comprehensive explanation component."""
-    st.markdown('<div class="explanation-section">', unsafe_allow_html=True)
-    
+    header = [f"## {idx}. {result.title}"]
     if is_top_recommendation:
-        st.markdown('<div class="recommended-badge">⭐ TOP RECOMMENDATION</div>', unsafe_allow_html=True)
-    
-    st.markdown("### 💡 Why This Intervention?")
-    
-    # Show explanation prominently
-    if result.get("explanation"):
-        st.markdown(result["explanation"])
-    else:
-        st.markdown("This intervention matches your road safety issue based on the IRC standards database.")
-    
-    # Note: IRC references are now shown primarily in display_result function
-    # This section is kept for backward compatibility but IRC is shown first in main display
-    
-    st.markdown('</div>', unsafe_allow_html=True)
+        header.append(BEST_MATCH_BADGE)
+    header.append(get_confidence_badge(result.confidence))
+
+    # IRC Standard References - PRIMARY/PROMINENT DISPLAY
+    if irc_code:
+        header += [
+            "---",
+            "### 📚 IRC Standard Reference (Primary Source)",
+            IRC_BANNER_TEMPLATE.format(code=irc_code, clause=result.irc_reference.clause),
+        ]
+        # Show IRC excerpt prominently (not in expander)
+        if result.irc_reference.excerpt:
+            header.append("#### 📄 IRC Standard Excerpt:")
+
+    basic = [
+        ("Category", result.category),
+        ("Problem", result.problem),
+        ("Type", result.type),
+    ]
+    cost = [
+        ("Cost Estimate", result.cost_estimate),
+        ("Installation Time", result.installation_time),
+    ]
+    if result.maintenance:
+        cost.append(("Maintenance", f"{result.maintenance[:50]}..."))
+
+    # Explanation and the three detail columns (as a CSS grid)
+    body = ["---"] if irc_code else []
+    body.append(format_explanation(result, is_top_recommendation=is_top_recommendation))
+    body.append(
+        '<div class="detail-grid">'
+        f"<div><h4>📋 Basic Information</h4>{format_fields(basic)}</div>"
+        f"<div><h4>📊 Specifications</h4>{format_fields(spec_summary)}</div>"
+        f"<div><h4>💰 Cost & Time</h4>{format_fields(cost)}</div>"
+        "</div>"
+    )
+
+    return "\n\n".join(header), "\n\n".join(body), format_fields(spec_summary + spec_extra)
 
 
-def display_result(result, idx, is_top_recommendation=False):
+def display_result(result: Result, idx, is_top_recommendation=False):
     """Display a single result with enhanced layout for evaluation criteria."""
+    # Static HTML is built once per result and search; reruns only re-send the cached strings
+    search_key = st.session_state.get("last_search_key")
+    cached = st.session_state.get("result_html")
+    if cached is None or cached[0] != search_key:
+        cached = (search_key, {})
+        st.session_state.result_html = cached
+    key = (result.id, idx)
+    if key not in cached[1]:
+        cached[1][key] = render_result_html(result, idx, is_top_recommendation=is_top_recommendation)
+    header_html, body_html, specs_html = cached[1][key]
+
+    irc_code = result.irc_reference.code
+    irc_excerpt = result.irc_reference.excerpt if irc_code else None
+
     with st.container():
-        # Recommended Intervention Section
-        st.markdown(f"## {idx}. {result['title']}")
-        
-        if is_top_recommendation:
-            st.markdown('<div class="recommended-badge">🏆 BEST MATCH</div>', unsafe_allow_html=True)
-        
-        # Confidence badge
-        st.markdown(get_confidence_badge(result["confidence"]), unsafe_allow_html=True)
-        
-        # IRC Standard References - PRIMARY/PROMINENT DISPLAY
-        irc_ref = result.get("irc_reference", {})
-        if irc_ref.get("code"):
-            st.markdown("---")
-            st.markdown("### 📚 IRC Standard Reference (Primary Source)")
-            # Large prominent badge
-            irc_code = irc_ref.get("code", "N/A")
-            irc_clause = irc_ref.get("clause", "N/A")
-            st.markdown(
-                f'<div style="background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); padding: 20px; border-radius: 10px; margin: 15px 0;">'
-                f'<h3 style="color: white; margin: 0;">📖 {irc_code}</h3>'
-                f'<p style="color: white; margin: 5px 0 0 0; font-size: 1.1em;">Clause {irc_clause}</p>'
-                f'</div>',
-                unsafe_allow_html=True
+        st.markdown(header_html, unsafe_allow_html=True)
+        if irc_excerpt:
+            st.info(irc_excerpt)
+        st.markdown(body_html, unsafe_allow_html=True)
+
+        # Detailed sections share one tab strip, built only once the user asks for it
+        # (tab and expander bodies run on every rerun even while hidden)
+        if st.toggle("Show detailed sections", key=f"details_{idx}"):
+            specs_tab, maintenance_tab, irc_tab = st.tabs(
+                ["📋 Full Specifications", "🔧 Maintenance Details", "📚 Additional IRC Details"]
             )
-            
-            # Show IRC excerpt prominently (not in expander)
-            if irc_ref.get("excerpt"):
-                st.markdown("#### 📄 IRC Standard Excerpt:")
-                st.info(irc_ref["excerpt"])
-            
-            st.markdown("---")
-        
-        # Explanation Section (prominent)
-        display_explanation(result, is_top_recommendation=is_top_recommendation)
-        
-        # Details in columns
-        col1, col2, col3 = st.columns(3)
 
-        with col1:
-            st.markdown("#### 📋 Basic Information")
-            st.markdown(f"**Category:** {result['category']}")
-            st.markdown(f"**Problem:** {result['problem']}")
-            st.markdown(f"**Type:** {result.get('type', 'N/A')}")
+            with specs_tab:
+                if specs_html:
+                    st.markdown(specs_html, unsafe_allow_html=True)
 
-        with col2:
-            st.markdown("#### 📊 Specifications")
-            specs = result.get("specifications", {})
-            if specs.get("dimensions"):
-                st.markdown(f"**Dimensions:** {specs['dimensions']}")
-            if specs.get("colors"):
-                st.markdown(f"**Colors:** {', '.join(specs['colors']) if isinstance(specs['colors'], list) else specs['colors']}")
-            if specs.get("placement"):
-                st.markdown(f"**Placement:** {specs['placement']}")
-
-        with col3:
-            st.markdown("#### 💰 Cost & Time")
-            st.markdown(f"**Cost Estimate:** {result['cost_estimate']}")
-            st.markdown(f"**Installation Time:** {result.get('installation_time', 'N/A')}")
-            if result.get("maintenance"):
-                st.markdown(f"**Maintenance:** {result['maintenance'][:50]}...")
-
-        # Expandable detailed sections
-        with st.expander("📋 Full Specifications"):
-            specs = result.get("specifications", {})
-            if specs.get("dimensions"):
-                st.markdown(f"**Dimensions:** {specs['dimensions']}")
-            if specs.get("colors"):
-                st.markdown(f"**Colors:** {', '.join(specs['colors']) if isinstance(specs['colors'], list) else specs['colors']}")
-            if specs.get("placement"):
-                st.markdown(f"**Placement:** {specs['placement']}")
-            if specs.get("shape"):
-                st.markdown(f"**Shape:** {specs['shape']}")
-            if specs.get("materials"):
-                st.markdown(f"**Materials:** {specs['materials']}")
-
-        with st.expander("🔧 Maintenance Details"):
-            st.markdown(result.get("maintenance", "Standard maintenance required"))
-
-        # IRC reference is already shown prominently at the top, so we don't need this expander
-        # Keeping it for additional details if needed
-        with st.expander("📚 Additional IRC Details"):
-            irc_ref = result.get("irc_reference", {})
-            st.markdown(f"**Full IRC Code:** {irc_ref.get('code', 'N/A')}")
-            st.markdown(f"**Clause Number:** {irc_ref.get('clause', 'N/A')}")
-            st.info("💡 IRC Standard Reference is displayed prominently at the top of this result.")
+            with maintenance_tab:
+                st.markdown(result.maintenance or "Standard maintenance required")
+
+            # IRC reference is already shown prominently at the top; this tab holds the raw fields
+            with irc_tab:
+                st.markdown(
+                    f"**Full IRC Code:** {irc_code or 'N/A'}  \n**Clause Number:** {result.irc_reference.clause}"
+                )
+                st.info("💡 IRC Standard Reference is displayed prominently at the top of this result.")
 
         st.markdown("---")
 
 
+@st.fragment
+def render_results(response: SearchResponse):
+    """Render a search response; widget clicks inside rerun only this fragment."""
+    # Display results
+    st.success(
+        f"✅ Found {response.metadata.get('total_results', len(response.results))} recommended intervention(s)"
+        f" in {response.metadata.get('query_time_ms', 'N/A')}ms"
+    )
+
+    # Results
+    if response.results:
+        st.header("📊 Recommended Road Safety Intervention(s)")
+
+        # One summary table instead of a full detail block per result
+        summary = pd.DataFrame(
+            [
+                {
+                    "#": idx,
+                    "Intervention": result.title,
+                    "Category": result.category,
+                    "Problem": result.problem,
+                    "IRC": result.irc_reference.code or "N/A",
+                    "Cost": result.cost_estimate,
+                    "Confidence": round(result.confidence * 100),
+                }
+                for idx, result in enumerate(response.results, 1)
+            ]
+        )
+        table = st.dataframe(
+            summary,
+            hide_index=True,
+            use_container_width=True,
+            column_config={"Confidence": st.column_config.NumberColumn(format="%d%%")},
+            on_select="rerun",
+            selection_mode="single-row",
+            key="results_table",
+        )
+
+        # Full details only for the selected row; the top recommendation until one is picked
+        selected_rows = [row for row in table.selection.rows if row < len(response.results)]
+        selected = selected_rows[0] if selected_rows else 0
+        if selected > 0:
+            st.subheader("Additional Intervention Options")
+        display_result(response.results[selected], selected + 1, is_top_recommendation=selected == 0)
+
+        # Export functionality; the JSON is encoded once per search and reused by both buttons
+        search_key = st.session_state.get("last_search_key")
+        exported = st.session_state.get("last_response_bytes")
+        if exported is None or exported[0] != search_key:
+            exported = (search_key, orjson.dumps(msgspec.to_builtins(response), option=orjson.OPT_INDENT_2))
+            st.session_state.last_response_bytes = exported
+
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            st.download_button(
+                label="📥 Download Results (JSON)",
+                data=exported[1],
+                file_name=f"interventions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
+                mime="application/json",
+            )
+        with col2:
+            if st.button("📋 Copy to Clipboard"):
+                st.code(exported[1].decode(), language="json")
+                st.success("Results copied! (Use Ctrl+C)")
+
+        # AI Synthesis
+        if response.synthesis:
+            st.header("💬 AI Analysis & Recommendations")
+            st.markdown(response.synthesis)
+
+    else:
+        # Empty state
+        st.markdown('<div class="empty-state">', unsafe_allow_html=True)
+        st.info("📭 No interventions found matching your query.")
+        st.markdown("### Suggestions:")
+        st.markdown("- Try rephrasing your query")
+        st.markdown("- Remove some filters")
+        st.markdown("- Use more general terms")
+        st.markdown("### Example queries:")
+        for example in EXAMPLES[:3]:
+            if st.button(f"Try: {example}", key=f"example_{example}"):
+                st.session_state.query_text = example
+                st.rerun()
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Metadata, rendered only when requested as plain highlighted JSON (lighter than st.json's tree)
+    if st.toggle("ℹ️ Show search metadata", key="show_metadata"):
+        search_key = st.session_state.get("last_search_key")
+        cached = st.session_state.get("metadata_json")
+        if cached is None or cached[0] != search_key:
+            cached = (search_key, orjson.dumps(response.metadata, option=orjson.OPT_INDENT_2).decode())
+            st.session_state.metadata_json = cached
+        st.code(cached[1], language="json")
+
+
 def main():
     """Main app."""
     # Header
@@ -242,9 +445,9 @@ def main():
 
     # Initialize session state for API config
     if "api_url" not in st.session_state:
-        st.session_state.api_url = os.getenv("API_URL", "http://localhost:8000")
+        st.session_state.api_url = DEFAULT_API_URL
     if "api_key" not in st.session_state:
-        st.session_state.api_key = os.getenv("API_KEY", "")
+        st.session_state.api_key = DEFAULT_API_KEY
 
     # Sidebar
     with st.sidebar:
@@ -257,8 +460,8 @@ def main():
 
             if st.button("Test Connection"):
                 try:
-                    client = APIClient(base_url=api_url, api_key=api_key)
-                    health = client.health_check()
+                    # Short read timeout: a hung backend shouldn't block the page
+                    health = get_api_client(api_url, api_key, timeout=3).health_check()
                     if health["status"] == "healthy":
                         st.success("✅ Connection successful!")
                         # Save to session state
@@ -271,69 +474,56 @@ def main():
 
         # Filters
         st.header("🔍 Filters")
+        st.caption("Filters are set with the query in the search form.")
 
-        # Initialize API client with session state values (but don't call API during init)
-        api_client = APIClient(base_url=st.session_state.api_url, api_key=st.session_state.api_key)
-
-        # Always use defaults immediately - NO API calls during initialization to avoid blocking deployment
+        # Always use defaults immediately - NO blocking API calls during initialization to avoid blocking deployment
         if "categories" not in st.session_state:
             st.session_state.categories = ["Road Sign", "Road Marking", "Traffic Calming Measures"]
         if "problems" not in st.session_state:
             st.session_state.problems = ["Damaged", "Faded", "Missing"]
-        
+
+        # Metadata is fetched in the background while the user types; swap it in once it has arrived
+        remote_api = st.session_state.api_url and "localhost" not in st.session_state.api_url
+        prefetch = prefetch_metadata(st.session_state.api_url, st.session_state.api_key) if remote_api else {}
+        if not st.session_state.get("filters_from_api"):
+            prefetched_categories = get_prefetched(prefetch, "categories")
+            prefetched_problems = get_prefetched(prefetch, "problems")
+            if prefetched_categories and prefetched_problems:
+                st.session_state.categories = prefetched_categories
+                st.session_state.problems = prefetched_problems
+                st.session_state.filters_from_api = True
+
         # Use cached/default values (no blocking API calls)
         categories = st.session_state.categories
         problems = st.session_state.problems
         
         # Optional: Add a button to refresh filters from API (non-blocking, user-initiated)
-        if st.session_state.api_url and "localhost" not in st.session_state.api_url:
+        if remote_api:
             if st.button("🔄 Refresh Filters from API", help="Fetch latest categories and problems"):
                 try:
                     with st.spinner("Fetching filters..."):
-                        filter_client = APIClient(
-                            base_url=st.session_state.api_url, 
-                            api_key=st.session_state.api_key,
-                            timeout=3
+                        # An explicit refresh bypasses the TTL cache that passive page loads use
+                        fetch_filter_options.clear()
+                        new_categories, new_problems = fetch_filter_options(
+                            st.session_state.api_url, st.session_state.api_key
                         )
-                        new_categories = filter_client.get_categories()
-                        new_problems = filter_client.get_problems()
                         st.session_state.categories = new_categories
                         st.session_state.problems = new_problems
+                        st.session_state.filters_from_api = True
                     st.success("✅ Filters updated!")
                     st.rerun()
                 except Exception as e:
                     st.warning(f"⚠️ Could not refresh: {str(e)}. Using default filters.")
 
-        selected_categories = st.multiselect("Category", options=categories, default=[])
-
-        selected_problems = st.multiselect("Problem Type", options=problems, default=[])
-
-        # Speed range
-        use_speed_filter = st.checkbox("Filter by Speed Range")
-        speed_min = None
-        speed_max = None
-
-        if use_speed_filter:
-            speed_min = st.number_input("Min Speed (km/h)", min_value=0, max_value=200, value=0)
-            speed_max = st.number_input("Max Speed (km/h)", min_value=0, max_value=200, value=100)
-
-        # Strategy
-        strategy = st.selectbox(
-            "Search Strategy",
-            options=["auto", "hybrid", "rag", "structured"],
-            help="Auto: Automatically select best strategy\nHybrid: Combine RAG and structured search\nRAG: Semantic vector search\nStructured: Exact match queries",
-        )
-
-        # Max results
-        max_results = st.slider("Max Results", min_value=1, max_value=10, value=5)
-
         # Database stats - lazy loaded only when expander is opened
         with st.expander("📊 Database Statistics"):
             # Only fetch stats when user opens the expander (lazy loading)
             if st.button("📊 Load Statistics", key="load_stats"):
                 try:
                     with st.spinner("Loading statistics..."):
-                        stats = api_client.get_stats()
+                        stats = get_prefetched(prefetch, "stats") or fetch_stats(
+                            st.session_state.api_url, st.session_state.api_key
+                        )
                         st.metric("Total Interventions", stats["total_interventions"])
 
                         st.write("**Categories:**")
@@ -348,31 +538,75 @@ def main():
     st.header("🔍 Search for Road Safety Interventions")
 
     # Quick examples
-    examples = [
-        "Faded STOP sign on 65 kmph highway",
-        "Missing road markings at pedestrian crossing",
-        "Damaged speed breaker on urban road",
-        "Obstruction blocking road sign visibility",
-    ]
+    example_choice = st.selectbox("Quick Examples (optional):", EXAMPLE_OPTIONS)
 
-    example_choice = st.selectbox("Quick Examples (optional):", [""] + examples)
+    # Outside the form so ticking it reveals the speed inputs straight away
+    use_speed_filter = st.checkbox("Filter by Speed Range")
 
-    # Search box
-    query = st.text_area(
-        "Describe the road safety issue:", value=example_choice if example_choice else "", height=100, help="Describe the road safety problem in natural language"
-    )
+    # Query and filters share one form: edits don't rerun the script, and Search submits them all together
+    with st.form("search_form"):
+        query = st.text_area(
+            "Describe the road safety issue:", value=example_choice if example_choice else "", height=100, help="Describe the road safety problem in natural language"
+        )
+
+        col1, col2 = st.columns(2)
+        with col1:
+            selected_categories = st.multiselect("Category", options=categories, default=[])
+        with col2:
+            selected_problems = st.multiselect("Problem Type", options=problems, default=[])
+
+        # Speed range
+        speed_min = None
+        speed_max = None
+        if use_speed_filter:
+            col1, col2 = st.columns(2)
+            with col1:
+                speed_min = st.number_input("Min Speed (km/h)", min_value=0, max_value=200, value=0)
+            with col2:
+                speed_max = st.number_input("Max Speed (km/h)", min_value=0, max_value=200, value=100)
+
+        col1, col2 = st.columns(2)
+        with col1:
+            # Strategy
+            strategy = st.selectbox(
+                "Search Strategy",
+                options=STRATEGIES,
+                help="Auto: Automatically select best strategy\nHybrid: Combine RAG and structured search\nRAG: Semantic vector search\nStructured: Exact match queries",
+            )
+        with col2:
+            # Max results
+            max_results = st.slider("Max Results", min_value=1, max_value=10, value=5)
+
+        submitted = st.form_submit_button("🔍 Search", type="primary", use_container_width=True)
+
+    if submitted:
+        search_params = {
+            "query": query,
+            "category": sorted(selected_categories),
+            "problem": sorted(selected_problems),
+            "speed_min": speed_min,
+            "speed_max": speed_max,
+            "strategy": strategy,
+            "max_results": max_results,
+        }
+        search_key = hashlib.md5(orjson.dumps(search_params, option=orjson.OPT_SORT_KEYS)).hexdigest()
 
-    # Search button
-    if st.button("🔍 Search", type="primary", use_container_width=True):
         if not query:
             st.warning("⚠️ Please enter a query")
+        elif st.session_state.get("last_search_key") == search_key and st.session_state.get("last_response") is not None:
+            # Same search as the results already on screen; they render from session state below
+            pass
         else:
             # Initialize session state for retry
             if "last_query" not in st.session_state:
                 st.session_state.last_query = None
             if "retry_count" not in st.session_state:
                 st.session_state.retry_count = 0
-            
+
+            # Drop the previous results so a failed search doesn't show stale ones
+            st.session_state.pop("last_response", None)
+            st.session_state.pop("last_search_key", None)
+
             # Show loading state
             progress_bar = st.progress(0)
             status_text = st.empty()
@@ -380,96 +614,43 @@ def main():
             try:
                 status_text.text("🔍 Searching interventions database...")
                 progress_bar.progress(20)
-                
-                # Make API call
-                start_time = time.time()
-                response = api_client.search(
-                    query=query,
-                    category=selected_categories if selected_categories else None,
-                    problem=selected_problems if selected_problems else None,
-                    speed_min=speed_min,
-                    speed_max=speed_max,
-                    strategy=strategy,
-                    max_results=max_results,
-                )
-                
+
+                search_cache, search_cache_lock = get_search_cache()
+                cache_key = (st.session_state.api_url, st.session_state.api_key, search_key)
+                with search_cache_lock:
+                    response = search_cache.get(cache_key)
+
+                if response is None:
+                    # List results as they stream in; the full layout renders once the synthesis arrives
+                    previews = []
+
+                    def show_result(idx, result):
+                        previews.append(
+                            f"**{idx}. {html.escape(result.title)}** {get_confidence_badge(result.confidence)}"
+                        )
+                        status_text.markdown(
+                            "💬 Generating AI analysis...  \n" + "  \n".join(previews), unsafe_allow_html=True
+                        )
+                        progress_bar.progress(min(20 + 60 * idx // max_results, 80))
+
+                    client = get_api_client(st.session_state.api_url, st.session_state.api_key)
+                    response = stream_search(client, search_params, show_result)
+                    with search_cache_lock:
+                        search_cache[cache_key] = response
+
                 progress_bar.progress(100)
-                elapsed_time = time.time() - start_time
-                
+
                 # Clear loading indicators
                 progress_bar.empty()
                 status_text.empty()
                 
                 # Store query for retry
-                st.session_state.last_query = {
-                    "query": query,
-                    "category": selected_categories,
-                    "problem": selected_problems,
-                    "speed_min": speed_min,
-                    "speed_max": speed_max,
-                    "strategy": strategy,
-                    "max_results": max_results,
-                }
+                st.session_state.last_query = search_params
                 st.session_state.retry_count = 0
 
-                # Display results
-                st.success(
-                    f"✅ Found {response['metadata']['total_results']} recommended intervention(s) in {response['metadata']['query_time_ms']}ms"
-                )
-
-                # Results
-                if response["results"]:
-                    st.header("📊 Recommended Road Safety Intervention(s)")
-                    
-                    # Show top recommendation prominently
-                    if len(response["results"]) > 0:
-                        display_result(response["results"][0], 1, is_top_recommendation=True)
-                    
-                    # Show other recommendations
-                    if len(response["results"]) > 1:
-                        st.subheader("Additional Intervention Options")
-                        for idx, result in enumerate(response["results"][1:], 2):
-                            display_result(result, idx, is_top_recommendation=False)
-                    
-                    # Export functionality
-                    col1, col2, col3 = st.columns(3)
-                    with col1:
-                        if st.button("📥 Download Results (JSON)"):
-                            json_str = json.dumps(response, indent=2)
-                            st.download_button(
-                                label="Download",
-                                data=json_str,
-                                file_name=f"interventions_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json",
-                                mime="application/json"
-                            )
-                    with col2:
-                        if st.button("📋 Copy to Clipboard"):
-                            st.code(json.dumps(response, indent=2), language="json")
-                            st.success("Results copied! (Use Ctrl+C)")
-                    
-                    # AI Synthesis
-                    if response.get("synthesis"):
-                        st.header("💬 AI Analysis & Recommendations")
-                        st.markdown(response["synthesis"])
-
-                else:
-                    # Empty state
-                    st.markdown('<div class="empty-state">', unsafe_allow_html=True)
-                    st.info("📭 No interventions found matching your query.")
-                    st.markdown("### Suggestions:")
-                    st.markdown("- Try rephrasing your query")
-                    st.markdown("- Remove some filters")
-                    st.markdown("- Use more general terms")
-                    st.markdown("### Example queries:")
-                    for example in examples[:3]:
-                        if st.button(f"Try: {example}", key=f"example_{example}"):
-                            st.session_state.query_text = example
-                            st.rerun()
-                    st.markdown('</div>', unsafe_allow_html=True)
-
-                # Metadata (collapsible)
-                with st.expander("ℹ️ Search Metadata"):
-                    st.json(response["metadata"])
+                # Keep the response so results survive reruns and identical resubmits
+                st.session_state.last_response = response
+                st.session_state.last_search_key = search_key
 
             except NetworkError as e:
                 progress_bar.empty()
@@ -509,11 +690,12 @@ def main():
                 st.markdown("- Filter values are valid")
                 
             except Exception as e:
+                # Traceback goes to the server log; the page only gets a summary
+                logger.exception("Search failed")
                 progress_bar.empty()
                 status_text.empty()
                 st.error("❌ An unexpected error occurred.")
-                st.markdown(f"**Error:** {str(e)}")
-                st.markdown("**Error Type:** " + type(e).__name__)
+                st.markdown(f"**Error:** {str(e)}  \n**Error Type:** {type(e).__name__}")
                 
                 # Show retry option
                 if st.session_state.retry_count < 3:
@@ -522,16 +704,16 @@ def main():
                         st.rerun()
                 else:
                     st.warning("Maximum retry attempts reached. Please check your query and try again.")
-                    
-                # Show technical details in expander
-                with st.expander("🔍 Technical Details"):
-                    st.exception(e)
+
+    # Results persist across reruns until the next search
+    if st.session_state.get("last_response") is not None:
+        render_results(st.session_state.last_response)
 
     # Footer
     st.markdown("---")
     st.markdown(
         """
-    <div style="text-align: center; color: #666;">
+    <div class="footer">
         <p>Road Safety Intervention AI | Powered by Google Gemini | Version 1.0.0</p>
     </div>
     """,
@@ -1,13 +1,26 @@
 """API client for backend communication."""
-import requests
-from typing import Dict, Any, Optional, List
+import importlib.util
+import httpx
+import msgspec
+import orjson
+from typing import Dict, Any, Iterator, Optional, List, Tuple
 import os
+import threading
 import time
 from datetime import datetime
 from dotenv import load_dotenv
 
+from .models import Result, SearchResponse
+
 load_dotenv()
 
+# Resolved once per process; Streamlit re-executes the app script but not imported modules
+DEFAULT_API_URL = os.getenv("API_URL", "http://localhost:8000")
+DEFAULT_API_KEY = os.getenv("API_KEY", "")
+
+# HTTP/2 needs the h2 package (installed via httpx[http2]); fall back to HTTP/1.1 without it
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
 
 class APIError(Exception):
     """Base API error."""
@@ -31,6 +44,13 @@ class ValidationError(APIError):
 class APIClient:
     """Client for Road Safety API."""
 
+    # Seconds to wait for a TCP connection; `timeout` bounds the read
+    CONNECT_TIMEOUT = 3
+
+    # Circuit breaker: after this many consecutive failed calls, refuse calls for CIRCUIT_OPEN_SECONDS
+    CIRCUIT_FAILURE_THRESHOLD = 3
+    CIRCUIT_OPEN_SECONDS = 30
+
     def __init__(
         self,
         base_url: Optional[str] = None,
@@ -39,28 +59,102 @@ class APIClient:
         max_retries: int = 3,
     ):
         """Initialize API client."""
-        self.base_url = base_url or os.getenv("API_URL", "http://localhost:8000")
-        self.api_key = api_key or os.getenv("API_KEY", "")
+        self.base_url = base_url or DEFAULT_API_URL
+        self.api_key = api_key or DEFAULT_API_KEY
         self.headers = {"X-API-Key": self.api_key, "Content-Type": "application/json"}
         self.timeout = timeout
         self.max_retries = max_retries
 
+        # Consecutive failed calls and when the open circuit may be retried (monotonic seconds);
+        # the lock guards both, since one client is shared across sessions
+        self._failures = 0
+        self._open_until = 0.0
+        self._circuit_lock = threading.Lock()
+
+        # Last ETag and decoded body per URL, for conditional GETs of rarely-changing data
+        self._etag_cache: Dict[str, tuple] = {}
+
+        # Decodes and validates search bodies straight into typed models
+        self._search_decoder = msgspec.json.Decoder(SearchResponse)
+
+        # Pooled client; with HTTP/2, concurrent prefetches multiplex over one connection.
+        # Retries stay in _make_request.
+        self._client = httpx.Client(
+            headers=self.headers,
+            timeout=httpx.Timeout(self.timeout, connect=self.CONNECT_TIMEOUT),
+            transport=httpx.HTTPTransport(
+                http2=HTTP2_AVAILABLE,
+                limits=httpx.Limits(max_connections=8, max_keepalive_connections=4),
+            ),
+        )
+
+    def close(self):
+        """Close pooled connections."""
+        self._client.close()
+
+    def __del__(self):
+        client = getattr(self, "_client", None)
+        if client is not None:
+            client.close()
+
+    def _check_circuit(self):
+        """Fail fast while the circuit is open."""
+        remaining = self._open_until - time.monotonic()
+        if remaining > 0:
+            raise NetworkError(
+                f"Backend unavailable after repeated failures; retrying in {remaining:.0f}s",
+                response={"error": "circuit open"},
+            )
+
+    def _record_failure(self):
+        """Count a failed call, opening the circuit at the threshold."""
+        # Not reset on opening, so a single failure after the pause (half-open) reopens it
+        with self._circuit_lock:
+            self._failures += 1
+            if self._failures >= self.CIRCUIT_FAILURE_THRESHOLD:
+                self._open_until = time.monotonic() + self.CIRCUIT_OPEN_SECONDS
+
+    def _record_success(self):
+        """Close the circuit."""
+        with self._circuit_lock:
+            self._failures = 0
+            self._open_until = 0.0
+
     def _make_request(
         self,
         method: str,
         url: str,
         retry_status_codes: List[int] = [500, 502, 503, 504],
         **kwargs
-    ) -> requests.Response:
+    ) -> httpx.Response:
+        """Make HTTP request through the circuit breaker."""
+        self._check_circuit()
+        try:
+            response = self._send_with_retries(method, url, retry_status_codes, **kwargs)
+        except NetworkError:
+            self._record_failure()
+            raise
+
+        # Retries exhausted on a server error: the backend is still failing
+        if response.status_code >= 500:
+            self._record_failure()
+        else:
+            self._record_success()
+        return response
+
+    def _send_with_retries(
+        self,
+        method: str,
+        url: str,
+        retry_status_codes: List[int],
+        **kwargs
+    ) -> httpx.Response:
         """Make HTTP request with retry logic."""
         last_exception = None
         
         for attempt in range(self.max_retries):
             try:
-                # Add timeout to kwargs
-                kwargs.setdefault("timeout", self.timeout)
-                
-                response = requests.request(method, url, headers=self.headers, **kwargs)
+                response = self._client.request(method, url, **kwargs)
                 
                 # Check if we should retry
                 if response.status_code in retry_status_codes and attempt < self.max_retries - 1:
@@ -68,13 +162,17 @@ class APIClient:
                     time.sleep(wait_time)
                     continue
                 
-                # Raise for status if not a retryable error
-                if response.status_code not in retry_status_codes:
+                # Raise for status if not a retryable error (304 answers a conditional GET)
+                if response.status_code not in retry_status_codes and response.status_code != 304:
                     response.raise_for_status()
                 
                 return response
                 
-            except requests.exceptions.Timeout as e:
+            except httpx.HTTPStatusError:
+                # Non-retryable status; callers map it to APIError/ValidationError
+                raise
+
+            except httpx.TimeoutException as e:
                 last_exception = e
                 if attempt < self.max_retries - 1:
                     wait_time = 2 ** attempt
@@ -82,7 +180,7 @@ class APIClient:
                     continue
                 raise NetworkError(f"Request timeout after {self.timeout}s", response={"error": str(e)})
                 
-            except requests.exceptions.ConnectionError as e:
+            except httpx.TransportError as e:
                 last_exception = e
                 if attempt < self.max_retries - 1:
                     wait_time = 2 ** attempt
@@ -90,7 +188,7 @@ class APIClient:
                     continue
                 raise NetworkError(f"Connection error: {str(e)}", response={"error": str(e)})
                 
-            except requests.exceptions.RequestException as e:
+            except httpx.HTTPError as e:
                 last_exception = e
                 if attempt < self.max_retries - 1:
                     wait_time = 2 ** attempt
@@ -102,12 +200,26 @@ class APIClient:
         if last_exception:
             raise last_exception
 
-    def _handle_error_response(self, response: requests.Response):
+    def _get_revalidated(self, url: str) -> Any:
+        """GET with If-None-Match, reusing the cached body on 304."""
+        cached = self._etag_cache.get(url)
+        headers = {"If-None-Match": cached[0]} if cached else None
+
+        response = self._make_request("GET", url, headers=headers)
+        if response.status_code == 304 and cached:
+            return cached[1]
+
+        data = orjson.loads(response.content)
+        if "ETag" in response.headers:
+            self._etag_cache[url] = (response.headers["ETag"], data)
+        return data
+
+    def _handle_error_response(self, response: httpx.Response):
         """Handle error responses and raise appropriate exceptions."""
         status_code = response.status_code
         
         try:
-            error_data = response.json()
+            error_data = orjson.loads(response.content)
             error_message = error_data.get("detail", error_data.get("error", "Unknown error"))
         except:
             error_message = response.text or f"HTTP {status_code} error"
@@ -123,19 +235,17 @@ class APIClient:
         else:
             raise APIError(error_message, status_code=status_code)
 
-    def search(
-        self,
+    @staticmethod
+    def _search_payload(
         query: str,
-        category: Optional[List[str]] = None,
-        problem: Optional[List[str]] = None,
-        speed_min: Optional[int] = None,
-        speed_max: Optional[int] = None,
-        strategy: str = "auto",
-        max_results: int = 5,
+        category: Optional[List[str]],
+        problem: Optional[List[str]],
+        speed_min: Optional[int],
+        speed_max: Optional[int],
+        strategy: str,
+        max_results: int,
     ) -> Dict[str, Any]:
-        """Search for interventions."""
-        url = f"{self.base_url}/api/v1/search"
-
+        """Build the search request body."""
         payload = {"query": query, "strategy": strategy, "max_results": max_results}
 
         # Add filters if provided
@@ -152,10 +262,32 @@ class APIClient:
         if filters:
             payload["filters"] = filters
 
+        return payload
+
+    def search(
+        self,
+        query: str,
+        category: Optional[List[str]] = None,
+        problem: Optional[List[str]] = None,
+        speed_min: Optional[int] = None,
+        speed_max: Optional[int] = None,
+        strategy: str = "auto",
+        max_results: int = 5,
+    ) -> SearchResponse:
+        """Search for interventions."""
+        url = f"{self.base_url}/api/v1/search"
+        payload = self._search_payload(query, category, problem, speed_min, speed_max, strategy, max_results)
+
         try:
-            response = self._make_request("POST", url, json=payload)
-            return response.json()
-        except requests.exceptions.HTTPError as e:
+            # Content-Type: application/json is already a client default header
+            response = self._make_request("POST", url, content=orjson.dumps(payload))
+            # A retryable status comes back unraised once retries are exhausted
+            if response.is_error:
+                self._handle_error_response(response)
+            return self._search_decoder.decode(response.content)
+        except msgspec.ValidationError as e:
+            raise APIError(f"Invalid search response: {str(e)}")
+        except httpx.HTTPStatusError as e:
             if hasattr(e, 'response') and e.response is not None:
                 self._handle_error_response(e.response)
             else:
@@ -165,14 +297,81 @@ class APIClient:
         except Exception as e:
             raise NetworkError(f"Unexpected error: {str(e)}")
 
+    def search_stream(
+        self,
+        query: str,
+        category: Optional[List[str]] = None,
+        problem: Optional[List[str]] = None,
+        speed_min: Optional[int] = None,
+        speed_max: Optional[int] = None,
+        strategy: str = "auto",
+        max_results: int = 5,
+    ) -> Iterator[Tuple[str, Any]]:
+        """Search for interventions, yielding (event, data) as the backend streams them.
+
+        Events are one "result" (as a Result) per recommendation, then "synthesis" and "metadata".
+        Connection errors, timeouts and retryable statuses are retried with backoff until the
+        first event arrives; after that the stream can't be resumed, so errors are raised.
+        """
+        url = f"{self.base_url}/api/v1/search/stream"
+        payload = orjson.dumps(
+            self._search_payload(query, category, problem, speed_min, speed_max, strategy, max_results)
+        )
+        retry_status_codes = (500, 502, 503, 504)
+
+        self._check_circuit()
+        for attempt in range(self.max_retries):
+            can_retry = attempt < self.max_retries - 1
+            started = False
+            try:
+                with self._client.stream("POST", url, content=payload) as response:
+                    if response.status_code in retry_status_codes and can_retry:
+                        time.sleep(2 ** attempt)  # Exponential backoff
+                        continue
+
+                    if response.is_error:
+                        response.read()
+                        if response.status_code >= 500:
+                            self._record_failure()
+                        self._handle_error_response(response)
+
+                    for line in response.iter_lines():
+                        if not line:
+                            continue
+                        message = orjson.loads(line)
+                        if message["event"] == "error":
+                            raise APIError(message["data"]["detail"], status_code=500)
+                        started = True
+                        if message["event"] == "result":
+                            yield "result", msgspec.convert(message["data"], Result)
+                        else:
+                            yield message["event"], message["data"]
+            except msgspec.ValidationError as e:
+                raise APIError(f"Invalid search result: {str(e)}")
+            except httpx.TimeoutException as e:
+                if can_retry and not started:
+                    time.sleep(2 ** attempt)
+                    continue
+                self._record_failure()
+                raise NetworkError(f"Request timeout after {self.timeout}s", response={"error": str(e)})
+            except httpx.TransportError as e:
+                if can_retry and not started:
+                    time.sleep(2 ** attempt)
+                    continue
+                self._record_failure()
+                raise NetworkError(f"Connection error: {str(e)}", response={"error": str(e)})
+
+            self._record_success()
+            return
+
     def get_intervention(self, intervention_id: str) -> Dict[str, Any]:
         """Get specific intervention by ID."""
         url = f"{self.base_url}/api/v1/interventions/{intervention_id}"
 
         try:
             response = self._make_request("GET", url)
-            return response.json()
-        except requests.exceptions.HTTPError as e:
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
             self._handle_error_response(e.response)
         except (NetworkError, APIError):
             raise
@@ -191,8 +390,8 @@ class APIClient:
 
         try:
             response = self._make_request("GET", url, params=params)
-            return response.json()
-        except requests.exceptions.HTTPError as e:
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
             self._handle_error_response(e.response)
         except (NetworkError, APIError):
             raise
@@ -202,9 +401,8 @@ class APIClient:
         url = f"{self.base_url}/api/v1/interventions/categories/list"
 
         try:
-            response = self._make_request("GET", url)
-            return response.json()
-        except requests.exceptions.HTTPError as e:
+            return self._get_revalidated(url)
+        except httpx.HTTPStatusError as e:
             self._handle_error_response(e.response)
         except (NetworkError, APIError):
             raise
@@ -214,9 +412,8 @@ class APIClient:
         url = f"{self.base_url}/api/v1/interventions/problems/list"
 
         try:
-            response = self._make_request("GET", url)
-            return response.json()
-        except requests.exceptions.HTTPError as e:
+            return self._get_revalidated(url)
+        except httpx.HTTPStatusError as e:
             self._handle_error_response(e.response)
         except (NetworkError, APIError):
             raise
@@ -226,9 +423,8 @@ class APIClient:
         url = f"{self.base_url}/stats"
 
         try:
-            response = self._make_request("GET", url)
-            return response.json()
-        except requests.exceptions.HTTPError as e:
+            return self._get_revalidated(url)
+        except httpx.HTTPStatusError as e:
             self._handle_error_response(e.response)
         except (NetworkError, APIError):
             raise
@@ -239,8 +435,8 @@ class APIClient:
 
         try:
             response = self._make_request("GET", url)
-            return response.json()
-        except requests.exceptions.HTTPError as e:
+            return orjson.loads(response.content)
+        except httpx.HTTPStatusError as e:
             self._handle_error_response(e.response)
         except (NetworkError, APIError):
             raise
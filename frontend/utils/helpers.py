@@ -0,0 +1,29 @@
+"""Helper functions for rendering results."""
+
+# Badge HTML per confidence bucket: below 60%, 60-79%, 80% and up
+CONFIDENCE_BADGE_TEMPLATES = (
+    '<span class="confidence-badge low-confidence">⭐⭐⭐ {}%</span>',
+    '<span class="confidence-badge medium-confidence">⭐⭐⭐⭐ {}%</span>',
+    '<span class="confidence-badge high-confidence">⭐⭐⭐⭐⭐ {}%</span>',
+)
+
+BEST_MATCH_BADGE = '<div class="recommended-badge">🏆 BEST MATCH</div>'
+TOP_RECOMMENDATION_BADGE = '<div class="recommended-badge">⭐ TOP RECOMMENDATION</div>'
+
+# Styled by the .irc-banner rules in the app stylesheet
+IRC_BANNER_TEMPLATE = '<div class="irc-banner"><h3>📖 {code}</h3><p>Clause {clause}</p></div>'
+
+
+def _build_confidence_badge(percentage: int) -> str:
+    """Badge HTML for a whole-number percentage."""
+    bucket = 0 if percentage < 60 else 1 if percentage < 80 else 2
+    return CONFIDENCE_BADGE_TEMPLATES[bucket].format(percentage)
+
+
+# Every badge for 0-100%, built once at import
+CONFIDENCE_BADGES = tuple(_build_confidence_badge(percentage) for percentage in range(101))
+
+
+def get_confidence_badge(confidence: float) -> str:
+    """Get confidence badge HTML."""
+    return CONFIDENCE_BADGES[min(100, max(0, round(confidence * 100)))]
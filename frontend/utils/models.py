@@ -0,0 +1,53 @@
+"""Typed models for search responses."""
+from typing import Any, Dict, List, Optional
+
+import msgspec
+
+
+class Specifications(msgspec.Struct):
+    """Intervention specifications."""
+
+    shape: Optional[str] = None
+    dimensions: Optional[str] = None
+    colors: Optional[List[str]] = None
+    placement: Optional[str] = None
+    materials: Optional[str] = None
+    additional: Optional[Dict[str, Any]] = None
+
+
+class IrcReference(msgspec.Struct):
+    """IRC standard reference."""
+
+    code: str = ""
+    clause: str = "N/A"
+    excerpt: Optional[str] = None
+
+
+class Result(msgspec.Struct):
+    """A single recommended intervention."""
+
+    id: str = ""
+    title: str = ""
+    confidence: float = 0.0
+    problem: str = ""
+    category: str = ""
+    type: str = "N/A"
+    specifications: Specifications = msgspec.field(default_factory=Specifications)
+    explanation: str = ""
+    irc_reference: IrcReference = msgspec.field(default_factory=IrcReference)
+    cost_estimate: str = ""
+    installation_time: Optional[str] = "N/A"
+    maintenance: Optional[str] = None
+    raw_data: Optional[str] = None
+
+
+class SearchResponse(msgspec.Struct):
+    """Search response; metadata stays a plain dict since it is shown as raw JSON.
+
+    ``results`` and ``metadata`` are required so an error body can't decode as an empty response.
+    """
+
+    results: List[Result]
+    metadata: Dict[str, Any]
+    query: str = ""
+    synthesis: Optional[str] = None